@@ -0,0 +1,139 @@
+from array import array
+from math import gcd, isqrt
+from typing import Iterable, List, Optional
+
+from llm_benchmark.algorithms.primality import MillerRabin
+from llm_benchmark.algorithms.sieve import Sieve
+
+
+def _pollard_brent(n: int) -> int:
+    """Find a non-trivial factor of an odd composite n (Brent's variant)"""
+    batch = 128
+    c = 1
+    while True:
+        y, r, q, g = 2, 1, 1, 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += batch
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+        c += 1
+
+
+class Factorizer:
+    """Integer factorization with a smallest-prime-factor table
+
+    Numbers below ``spf_limit`` are factorized by walking a precomputed
+    smallest-prime-factor table, which costs one lookup per prime factor.
+    Larger numbers are stripped of small factors by trial division and the
+    remaining cofactor is split with Miller-Rabin and Pollard's rho. The
+    table is built lazily on first use and shared by every call.
+    """
+
+    SPF_LIMIT = 1 << 22
+    TRIAL_LIMIT = 1 << 10
+
+    def __init__(self, spf_limit: int = SPF_LIMIT, sieve: Optional[Sieve] = None):
+        """Create a factorizer
+
+        Args:
+            spf_limit (int): Exclusive bound of the smallest-prime-factor table
+            sieve (Optional[Sieve]): Sieve used to enumerate small primes
+        """
+        self._spf_limit = max(spf_limit, 2)
+        self._sieve = sieve if sieve is not None else Sieve()
+        self._spf: Optional[array] = None
+        self._trial_primes = list(self._sieve.primes_in_range(2, self.TRIAL_LIMIT))
+
+    @property
+    def spf(self) -> array:
+        """Smallest-prime-factor table, 0 for primes, 0 and 1"""
+        if self._spf is None:
+            self._spf = self._build_spf(self._spf_limit)
+        return self._spf
+
+    def factorize(self, n: int) -> List[int]:
+        """Prime factors of a number
+
+        Args:
+            n (int): Number to factorize
+
+        Returns:
+            List[int]: List of prime factors in increasing order, with multiplicity
+        """
+        if n < 2:
+            return []
+        if n < self._spf_limit:
+            return self._factorize_small(n)
+
+        ret = []
+        for p in self._trial_primes:
+            if p * p > n:
+                break
+            while n % p == 0:
+                ret.append(p)
+                n //= p
+        if n > 1:
+            self._factorize_large(n, ret)
+            ret.sort()
+        return ret
+
+    def factorize_many(self, values: Iterable[int]) -> List[List[int]]:
+        """Prime factors of many numbers, sharing one table
+
+        Args:
+            values (Iterable[int]): Numbers to factorize
+
+        Returns:
+            List[List[int]]: Prime factors of each number, in input order
+        """
+        factorize = self.factorize
+        return [factorize(n) for n in values]
+
+    def _factorize_small(self, n: int) -> List[int]:
+        spf = self.spf
+        ret = []
+        while n > 1:
+            p = spf[n] or n
+            ret.append(p)
+            n //= p
+        return ret
+
+    def _factorize_large(self, n: int, out: List[int]) -> None:
+        stack = [n]
+        while stack:
+            m = stack.pop()
+            if m < self._spf_limit:
+                out.extend(self._factorize_small(m))
+            elif MillerRabin.test(m):
+                out.append(m)
+            else:
+                root = isqrt(m)
+                if root * root == m:
+                    stack += [root, root]
+                    continue
+                d = _pollard_brent(m)
+                stack += [d, m // d]
+
+    def _build_spf(self, limit: int) -> array:
+        spf = array("I", bytes(4 * limit))
+        # Largest primes first so that smaller primes overwrite their multiples
+        for p in reversed(list(self._sieve.primes_in_range(2, isqrt(limit - 1) + 1))):
+            spf[p * p :: p] = array("I", [p]) * len(range(p * p, limit, p))
+        return spf
@@ -0,0 +1,133 @@
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import compress
+from math import isqrt
+from typing import Deque, Iterator, List, Optional, Tuple
+
+from llm_benchmark.algorithms.sieve import Sieve
+
+# Base primes of the current worker process, set by the pool initializer
+_BASE_PRIMES: List[int] = []
+
+
+def _init_worker(base_primes: List[int]) -> None:
+    global _BASE_PRIMES
+    _BASE_PRIMES = base_primes
+
+
+def _segment_stats(
+    lo: int, hi: int, base_primes: Optional[List[int]] = None
+) -> Tuple[int, int]:
+    if base_primes is None:
+        base_primes = _BASE_PRIMES
+    flags = Sieve.sieve_segment(lo, hi, base_primes)
+    return flags.count(1), sum(compress(range(lo, hi), flags))
+
+
+def _segment_primes(lo: int, hi: int) -> array:
+    flags = Sieve.sieve_segment(lo, hi, _BASE_PRIMES)
+    return array("Q", compress(range(lo, hi), flags))
+
+
+class ParallelSieve:
+    """Segmented sieve that spreads segments over a process pool
+
+    The range is cut into fixed-size segments. The primes up to the square
+    root of the upper bound are computed once in the parent and handed to
+    each worker when the pool starts, so every task is a single
+    ``Sieve.sieve_segment`` call. With a single worker the segments are
+    sieved in the calling process and no pool is started.
+    """
+
+    SEGMENT_SIZE = 1 << 22
+
+    def __init__(
+        self, workers: Optional[int] = None, segment_size: int = SEGMENT_SIZE
+    ) -> None:
+        """Create a parallel sieve
+
+        Args:
+            workers (Optional[int]): Number of worker processes, defaults to
+                the number of CPUs
+            segment_size (int): Number of integers sieved per task
+        """
+        if segment_size < 1:
+            raise ValueError("segment_size must be positive")
+        self._workers = workers or os.cpu_count() or 1
+        self._segment_size = segment_size
+
+    def count_and_sum(self, n: int) -> Tuple[int, int]:
+        """Number and sum of primes from 0 to n (exclusive)
+
+        Args:
+            n (int): Number to count up to
+
+        Returns:
+            Tuple[int, int]: Count and sum of primes below n
+        """
+        if n <= 2:
+            return 0, 0
+        if self._workers == 1:
+            base_primes = self._base_primes(n)
+            stats = [
+                _segment_stats(lo, hi, base_primes) for lo, hi in self._segments(0, n)
+            ]
+        else:
+            bounds = zip(*self._segments(0, n))
+            with self._executor(n) as executor:
+                stats = list(executor.map(_segment_stats, *bounds))
+        return sum(c for c, _ in stats), sum(s for _, s in stats)
+
+    def iter_primes(self, lo: int, hi: int) -> Iterator[int]:
+        """Yield primes in ``[lo, hi)`` in increasing order
+
+        At most two segments per worker are in flight at any time, so memory
+        stays bounded however large the range is.
+
+        Args:
+            lo (int): Inclusive lower bound
+            hi (int): Exclusive upper bound
+
+        Yields:
+            int: Primes in the range
+        """
+        lo = max(lo, 2)
+        if lo >= hi:
+            return
+        if self._workers == 1:
+            base_primes = self._base_primes(hi)
+            for seg_lo, seg_hi in self._segments(lo, hi):
+                flags = Sieve.sieve_segment(seg_lo, seg_hi, base_primes)
+                yield from compress(range(seg_lo, seg_hi), flags)
+            return
+
+        with self._executor(hi) as executor:
+            window = 2 * self._workers
+            pending: Deque[Future] = deque()
+            try:
+                for seg_lo, seg_hi in self._segments(lo, hi):
+                    pending.append(executor.submit(_segment_primes, seg_lo, seg_hi))
+                    if len(pending) >= window:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _executor(self, hi: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self._base_primes(hi),),
+        )
+
+    @staticmethod
+    def _base_primes(hi: int) -> List[int]:
+        return list(Sieve().primes_in_range(2, isqrt(hi - 1) + 1))
+
+    def _segments(self, lo: int, hi: int) -> Iterator[Tuple[int, int]]:
+        for seg_lo in range(lo, hi, self._segment_size):
+            yield seg_lo, min(seg_lo + self._segment_size, hi)
@@ -0,0 +1,93 @@
+from functools import lru_cache
+from typing import Tuple
+
+# Bases that make Miller-Rabin exact for every n < 2**64 (Jim Sinclair)
+BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+# First 13 primes: exact for every n < 3.3 * 10**24, a strong probable-prime
+# test beyond that
+BASES_WIDE = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Primes below 100, used as a trial-division pre-filter
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+SMALL_PRIMES += (53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+
+class MillerRabin:
+    """Deterministic Miller-Rabin primality test with an LRU result cache
+
+    Inputs are first trial-divided by the primes below 100, which rejects
+    most composites without any modular exponentiation. The survivors are
+    tested against a fixed witness set that is exact for all n < 2**64.
+    Results are memoised in a bounded LRU cache whose hit and miss counters
+    are available through :meth:`cache_info`.
+    """
+
+    MAXSIZE = 1 << 16
+
+    def __init__(self, maxsize: int = MAXSIZE) -> None:
+        """Create a tester
+
+        Args:
+            maxsize (int): Maximum number of cached results
+        """
+        self._cached = lru_cache(maxsize=maxsize)(MillerRabin.test)
+
+    def is_prime(self, n: int) -> bool:
+        """Check if a number is prime, consulting the cache first
+
+        Args:
+            n (int): Number to check
+
+        Returns:
+            bool: True if the number is prime, False otherwise
+        """
+        return self._cached(n)
+
+    def cache_info(self):
+        """Cache statistics
+
+        Returns:
+            CacheInfo: Named tuple of hits, misses, maxsize and currsize
+        """
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        """Drop all cached results and reset the counters"""
+        self._cached.cache_clear()
+
+    @staticmethod
+    def test(n: int) -> bool:
+        """Check if a number is prime, without caching
+
+        Args:
+            n (int): Number to check
+
+        Returns:
+            bool: True if the number is prime, False otherwise
+        """
+        if n < 2:
+            return False
+        for p in SMALL_PRIMES:
+            if n % p == 0:
+                return n == p
+        if n < 10000:
+            return True  # no prime factor below 100 <= sqrt(n)
+        bases: Tuple[int, ...] = BASES_64 if n < 1 << 64 else BASES_WIDE
+
+        d = n - 1
+        s = (d & -d).bit_length() - 1
+        d >>= s
+        for a in bases:
+            a %= n
+            if a == 0:
+                continue
+            x = pow(a, d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
@@ -1,23 +1,51 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional
+
+from llm_benchmark.algorithms.factor import Factorizer
+from llm_benchmark.algorithms.parallel import ParallelSieve
+from llm_benchmark.algorithms.primality import MillerRabin
+from llm_benchmark.algorithms.sieve import Sieve
+
+_SIEVE = Sieve()
+_FACTORIZER = Factorizer(sieve=_SIEVE)
+_MILLER_RABIN = MillerRabin()
+
+IS_PRIME_METHODS = ("auto", "sieve", "miller_rabin")
 
 
 class Primes:
     @staticmethod
-    def is_prime(n: int) -> bool:
+    def is_prime(n: int, method: str = "auto") -> bool:
         """Check if a number is prime
 
+        With ``method="auto"`` numbers already covered by the sieve are looked
+        up directly and everything else goes through the cached deterministic
+        Miller-Rabin test.
+
         Args:
             n (int): Number to check
+            method (str): One of "auto", "sieve" or "miller_rabin"
 
         Returns:
             bool: True if the number is prime, False otherwise
         """
-        if n < 2:
-            return False
-        for i in range(2, n):
-            if n % i == 0:
-                return False
-        return True
+        if method == "auto":
+            if n < _SIEVE.limit:
+                return _SIEVE.is_prime(n)
+            return _MILLER_RABIN.is_prime(n)
+        if method == "sieve":
+            return _SIEVE.is_prime(n)
+        if method == "miller_rabin":
+            return _MILLER_RABIN.is_prime(n)
+        raise ValueError(f"method must be one of {IS_PRIME_METHODS}, got {method!r}")
+
+    @staticmethod
+    def is_prime_cache_info():
+        """Hit/miss statistics of the Miller-Rabin result cache
+
+        Returns:
+            CacheInfo: Named tuple of hits, misses, maxsize and currsize
+        """
+        return _MILLER_RABIN.cache_info()
 
     @staticmethod
     def is_prime_ineff(n: int) -> bool:
@@ -50,20 +78,66 @@ class Primes:
 
 
     @staticmethod
-    def sum_primes(n: int) -> int:
+    def sum_primes(n: int, workers: Optional[int] = None) -> int:
         """Sum of primes from 0 to n (exclusive)
 
         Args:
             n (int): Number to sum up to
+            workers (Optional[int]): Sieve in this many processes, serially if None
 
         Returns:
             int: Sum of primes from 0 to n
         """
-        sum_ = 0
-        for i in range(n):
-            if Primes.is_prime(i):
-                sum_ += i
-        return sum_
+        if workers is None:
+            return _SIEVE.sum_primes(n)
+        return ParallelSieve(workers).count_and_sum(n)[1]
+
+    @staticmethod
+    def count_primes(n: int, workers: Optional[int] = None) -> int:
+        """Number of primes from 0 to n (exclusive)
+
+        Args:
+            n (int): Number to count up to
+            workers (Optional[int]): Sieve in this many processes, serially if None
+
+        Returns:
+            int: Number of primes from 0 to n
+        """
+        if workers is None:
+            return _SIEVE.count_primes(n)
+        return ParallelSieve(workers).count_and_sum(n)[0]
+
+    @staticmethod
+    def primes_in_range(lo: int, hi: int) -> Iterator[int]:
+        """Primes from lo (inclusive) to hi (exclusive)
+
+        Args:
+            lo (int): Lower bound
+            hi (int): Upper bound
+
+        Returns:
+            Iterator[int]: Generator of primes in increasing order
+        """
+        return _SIEVE.primes_in_range(lo, hi)
+
+    @staticmethod
+    def iter_primes(lo: int, hi: int, workers: Optional[int] = None) -> Iterator[int]:
+        """Stream primes from lo (inclusive) to hi (exclusive)
+
+        Unlike ``primes_in_range`` this does not keep the sieved range in
+        memory, and segments can be sieved in parallel.
+
+        Args:
+            lo (int): Lower bound
+            hi (int): Upper bound
+            workers (Optional[int]): Sieve in this many processes, serially if None
+
+        Returns:
+            Iterator[int]: Generator of primes in increasing order
+        """
+        if workers is None:
+            workers = 1
+        return ParallelSieve(workers).iter_primes(lo, hi)
 
     @staticmethod
     def prime_factors(n: int) -> List[int]:
@@ -75,11 +149,16 @@ class Primes:
         Returns:
             List[int]: List of prime factors
         """
-        ret = []
-        while n > 1:
-            for i in range(2, n + 1):
-                if n % i == 0:
-                    ret.append(i)
-                    n = n // i
-                    break
-        return ret
+        return _FACTORIZER.factorize(n)
+
+    @staticmethod
+    def factorize_many(values: Iterable[int]) -> List[List[int]]:
+        """Prime factors of many numbers
+
+        Args:
+            values (Iterable[int]): Numbers to factorize
+
+        Returns:
+            List[List[int]]: List of prime factors for each number
+        """
+        return _FACTORIZER.factorize_many(values)
@@ -0,0 +1,196 @@
+from itertools import compress
+from math import isqrt
+from typing import Iterator, List, Optional, Tuple
+
+
+class Sieve:
+    """Segmented, incrementally grown Sieve of Eratosthenes
+
+    The sieve keeps one byte per integer in ``[0, limit)`` (1 if prime, 0
+    otherwise) and extends itself segment by segment whenever a query needs
+    numbers beyond the current limit. Growth at least doubles the limit, so
+    a batch of increasing queries costs a single amortised sieve pass.
+
+    The table never grows past ``max_limit`` on its own. Ranges above it
+    are sieved one segment at a time against the primes up to the square
+    root of their upper bound, and primality checks above it use trial
+    division, so memory stays bounded however large the query.
+    """
+
+    INITIAL_LIMIT = 1 << 10
+    SEGMENT_SIZE = 1 << 18
+    MAX_LIMIT = 1 << 26
+
+    def __init__(
+        self, segment_size: int = SEGMENT_SIZE, max_limit: int = MAX_LIMIT
+    ) -> None:
+        """Create an empty sieve
+
+        Args:
+            segment_size (int): Number of integers sieved per segment
+            max_limit (int): Largest table queries may grow the sieve to
+        """
+        if segment_size < 1:
+            raise ValueError("segment_size must be positive")
+        self._segment_size = segment_size
+        self._max_limit = max_limit
+        self._flags = bytearray()
+        self._base_primes: List[int] = []
+        self._base_limit = 0
+
+    @property
+    def limit(self) -> int:
+        """Exclusive upper bound of the sieved range"""
+        return len(self._flags)
+
+    def extend(self, n: int) -> None:
+        """Grow the sieve so that it covers ``[0, n)``
+
+        Args:
+            n (int): Exclusive upper bound to cover
+        """
+        limit = self.limit
+        if n <= limit:
+            return
+        if limit == 0:
+            self._bootstrap(max(n, self.INITIAL_LIMIT))
+            return
+
+        new_limit = max(n, min(2 * limit, self._max_limit))
+        root = isqrt(new_limit - 1)
+        if root >= limit:
+            self.extend(root + 1)
+            limit = self.limit
+        base_primes = self._primes_below(root + 1)
+
+        for lo in range(limit, new_limit, self._segment_size):
+            hi = min(lo + self._segment_size, new_limit)
+            self._flags += self.sieve_segment(lo, hi, base_primes)
+
+    def is_prime(self, n: int) -> bool:
+        """Check if a number is prime, growing the sieve if needed
+
+        Args:
+            n (int): Number to check
+
+        Returns:
+            bool: True if the number is prime, False otherwise
+        """
+        if n < 2:
+            return False
+        if self._in_table(n + 1):
+            self.extend(n + 1)
+            return bool(self._flags[n])
+        for p in self.primes_in_range(2, isqrt(n) + 1):
+            if n % p == 0:
+                return False
+        return True
+
+    def primes_in_range(self, lo: int, hi: int) -> Iterator[int]:
+        """Yield primes in ``[lo, hi)`` in increasing order
+
+        The range is sieved one segment at a time as the generator
+        advances, so consuming only a prefix of a large range stays cheap.
+
+        Args:
+            lo (int): Inclusive lower bound
+            hi (int): Exclusive upper bound
+
+        Yields:
+            int: Primes in the range
+        """
+        for seg_lo, flags in self._segments(lo, hi):
+            yield from compress(range(seg_lo, seg_lo + len(flags)), flags)
+
+    def sum_primes(self, n: int) -> int:
+        """Sum of primes from 0 to n (exclusive)
+
+        Args:
+            n (int): Number to sum up to
+
+        Returns:
+            int: Sum of primes from 0 to n
+        """
+        if n <= 2:
+            return 0
+        if not self._in_table(n):
+            return sum(self.primes_in_range(2, n))
+        self.extend(n)
+        return sum(compress(range(n), memoryview(self._flags)[:n]))
+
+    def count_primes(self, n: int) -> int:
+        """Number of primes from 0 to n (exclusive)
+
+        Args:
+            n (int): Number to count up to
+
+        Returns:
+            int: Number of primes below n
+        """
+        if n <= 2:
+            return 0
+        if not self._in_table(n):
+            return sum(flags.count(1) for _, flags in self._segments(2, n))
+        self.extend(n)
+        return self._flags.count(1, 0, n)
+
+    def _in_table(self, n: int) -> bool:
+        """Whether ``[0, n)`` is, or may be grown to be, covered by the table"""
+        return n <= self.limit or n <= self._max_limit
+
+    def _segments(self, lo: int, hi: int) -> Iterator[Tuple[int, bytearray]]:
+        """Primality flags for ``[lo, hi)``, one segment at a time
+
+        Segments within reach of the table are sliced from it, growing it
+        as needed. Segments beyond ``max_limit`` are sieved on their own
+        with the primes up to ``isqrt(hi - 1)``, found the same way.
+        """
+        lo = max(lo, 2)
+        base_primes: Optional[List[int]] = None
+        while lo < hi:
+            seg_hi = min(lo + self._segment_size, hi)
+            if self._in_table(seg_hi):
+                self.extend(seg_hi)
+                yield lo, self._flags[lo:seg_hi]
+            else:
+                if base_primes is None:
+                    base_primes = list(self.primes_in_range(2, isqrt(hi - 1) + 1))
+                yield lo, self.sieve_segment(lo, seg_hi, base_primes)
+            lo = seg_hi
+
+    def _bootstrap(self, n: int) -> None:
+        flags = bytearray([1]) * n
+        flags[:2] = b"\x00\x00"
+        for p in range(2, isqrt(n - 1) + 1):
+            if flags[p]:
+                flags[p * p :: p] = bytes(len(range(p * p, n, p)))
+        self._flags = flags
+
+    def _primes_below(self, n: int) -> List[int]:
+        if n > self._base_limit:
+            self._base_primes = list(compress(range(n), self._flags[:n]))
+            self._base_limit = n
+        return self._base_primes
+
+    @staticmethod
+    def sieve_segment(lo: int, hi: int, base_primes: List[int]) -> bytearray:
+        """Primality flags for ``[lo, hi)``
+
+        Args:
+            lo (int): Inclusive lower bound
+            hi (int): Exclusive upper bound
+            base_primes (List[int]): All primes up to at least ``isqrt(hi - 1)``
+
+        Returns:
+            bytearray: One byte per integer, 1 if prime and 0 otherwise
+        """
+        seg = bytearray([1]) * (hi - lo)
+        for i in range(lo, min(2, hi)):
+            seg[i - lo] = 0
+        for p in base_primes:
+            pp = p * p
+            if pp >= hi:
+                break
+            start = max(pp, (lo + p - 1) // p * p)
+            seg[start - lo :: p] = bytes(len(range(start - lo, hi - lo, p)))
+        return seg
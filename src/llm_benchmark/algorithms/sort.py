@@ -1,19 +1,19 @@
-from sys import maxsize
 from typing import List
 
+from llm_benchmark.algorithms.sort_engine import SortEngine
+from llm_benchmark.algorithms.topk import METHODS, TopK
+
 
 class Sort:
     @staticmethod
-    def sort_list(v: List[int]) -> None:
+    def sort_list(v: List[int], strategy: str = "auto") -> None:
         """Sort a list of integers in place
 
         Args:
             v (List[int]): List of integers
+            strategy (str): Sort strategy, see SortEngine
         """
-        for i in range(len(v)):
-            for j in range(i + 1, len(v)):
-                if v[i] > v[j]:
-                    v[i], v[j] = v[j], v[i]
+        SortEngine.sort(v, strategy)
 
     @staticmethod
     def dutch_flag_partition(v: List[int], pivot_value: int) -> None:
@@ -35,25 +35,19 @@ class Sort:
                 next_value += 1
 
     @staticmethod
-    def max_n(v: List[int], n: int) -> List[int]:
+    def max_n(v: List[int], n: int, method: str = "heap") -> List[int]:
         """Find the maximum n numbers in a list
 
         Args:
             v (List[int]): List of integers
             n (int): Number of maximum values to find
+            method (str): "heap" or "select", see TopK
 
         Returns:
             List[int]: List of maximum n values
         """
-        tmp = v.copy()
-        ret = [-maxsize - 1] * n
-        for i in range(n):
-            max_val = tmp[0]
-            max_idx = 0
-            for j in range(1, len(tmp)):
-                if tmp[j] > max_val:
-                    max_val = tmp[j]
-                    max_idx = j
-            ret[i] = max_val
-            tmp.pop(max_idx)
-        return ret
+        if method == "heap":
+            return TopK.heap(v, n)
+        if method == "select":
+            return TopK.select(v, n)
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
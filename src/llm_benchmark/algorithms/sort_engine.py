@@ -0,0 +1,127 @@
+from collections import Counter
+from itertools import chain
+from typing import List
+
+STRATEGIES = ("auto", "timsort", "radix", "counting")
+
+
+class SortEngine:
+    """Pluggable sort strategies behind ``Sort.sort_list`` and ``DsList.sort_list``
+
+    * ``timsort``: the interpreter's adaptive hybrid sort, which detects
+      natural runs and merges them (``list.sort``).
+    * ``radix``: LSD radix sort on 16-bit digits, for integer keys.
+    * ``counting``: counts each distinct value once and emits the values in
+      order, for inputs with few distinct values.
+
+    ``auto`` inspects an evenly spaced sample of the input and picks
+    ``counting`` when the sample looks low-cardinality, ``timsort`` otherwise.
+    Radix sort is never faster than ``list.sort`` in pure Python, so it is
+    only used when requested explicitly.
+    """
+
+    SAMPLE_SIZE = 512
+    MIN_COUNTING_SIZE = 1 << 10
+    RADIX_BITS = 16
+
+    @staticmethod
+    def sort(v: List[int], strategy: str = "auto") -> None:
+        """Sort a list of integers in place
+
+        Args:
+            v (List[int]): List of integers
+            strategy (str): One of "auto", "timsort", "radix" or "counting"
+        """
+        if strategy == "auto":
+            strategy = SortEngine.choose_strategy(v)
+        if strategy == "timsort":
+            v.sort()
+        else:
+            v[:] = SortEngine.sorted_copy(v, strategy)
+
+    @staticmethod
+    def sorted_copy(v: List[int], strategy: str = "auto") -> List[int]:
+        """Sort a list of integers, returns a copy
+
+        Args:
+            v (List[int]): List of integers
+            strategy (str): One of "auto", "timsort", "radix" or "counting"
+
+        Returns:
+            List[int]: Sorted list of integers
+        """
+        if strategy == "auto":
+            strategy = SortEngine.choose_strategy(v)
+        if strategy == "timsort":
+            return sorted(v)
+        if strategy == "radix":
+            return SortEngine.radix_sort(v)
+        if strategy == "counting":
+            return SortEngine.counting_sort(v)
+        raise ValueError(f"strategy must be one of {STRATEGIES}, got {strategy!r}")
+
+    @staticmethod
+    def choose_strategy(v: List[int]) -> str:
+        """Pick a sort strategy from a sample of the input
+
+        Args:
+            v (List[int]): List of integers
+
+        Returns:
+            str: "counting" or "timsort"
+        """
+        n = len(v)
+        if n < SortEngine.MIN_COUNTING_SIZE:
+            return "timsort"
+        sample = v[:: max(1, n // SortEngine.SAMPLE_SIZE)]
+        if len(set(sample)) > len(sample) // 8:
+            return "timsort"
+        if set(map(type, v)) != {int}:
+            return "timsort"
+        return "counting"
+
+    @staticmethod
+    def counting_sort(v: List[int]) -> List[int]:
+        """Sort by counting occurrences of each distinct value
+
+        Runs in O(n + d log d) for d distinct values.
+
+        Args:
+            v (List[int]): List of integers
+
+        Returns:
+            List[int]: Sorted list of integers
+        """
+        counts = Counter(v)
+        ret: List[int] = []
+        for value in sorted(counts):
+            ret += [value] * counts[value]
+        return ret
+
+    @staticmethod
+    def radix_sort(v: List[int]) -> List[int]:
+        """LSD radix sort of integers, stable and O(n * key bits / 16)
+
+        Negative values are handled by offsetting every key by the minimum.
+
+        Args:
+            v (List[int]): List of integers
+
+        Returns:
+            List[int]: Sorted list of integers
+        """
+        if not v:
+            return []
+        lo = min(v)
+        span = max(v) - lo
+        bits = SortEngine.RADIX_BITS
+        mask = (1 << bits) - 1
+        ret = list(v)
+        shift = 0
+        while span >> shift:
+            buckets: List[List[int]] = [[] for _ in range(mask + 1)]
+            for x in ret:
+                buckets[((x - lo) >> shift) & mask].append(x)
+            ret = list(chain.from_iterable(buckets))
+            shift += bits
+        return ret
@@ -0,0 +1,127 @@
+import heapq
+from typing import Iterable, List
+
+METHODS = ("heap", "select")
+
+
+class TopK:
+    @staticmethod
+    def heap(v: List[int], k: int) -> List[int]:
+        """Largest k values using a bounded min-heap, O(n log k)
+
+        Args:
+            v (List[int]): List of integers
+            k (int): Number of values to keep
+
+        Returns:
+            List[int]: Largest k values in descending order
+        """
+        return heapq.nlargest(k, v)
+
+    @staticmethod
+    def select(v: List[int], k: int) -> List[int]:
+        """Largest k values using three-way quickselect, expected O(n + k log k)
+
+        Each round partitions around a median-of-three pivot and keeps only
+        the side that still contains the k-th largest value. After
+        ``2 * log2(n)`` rounds without converging the remaining candidates
+        are handed to a heap, which bounds the worst case to O(n log k).
+
+        Args:
+            v (List[int]): List of integers
+            k (int): Number of values to keep
+
+        Returns:
+            List[int]: Largest k values in descending order
+        """
+        if k <= 0:
+            return []
+        if k >= len(v):
+            return sorted(v, reverse=True)
+
+        ret: List[int] = []
+        work = v
+        depth = 2 * len(v).bit_length()
+        while k > 0:
+            if depth == 0:
+                ret += heapq.nlargest(k, work)
+                break
+            depth -= 1
+            pivot = sorted((work[0], work[len(work) // 2], work[-1]))[1]
+            greater = [x for x in work if x > pivot]
+            if len(greater) >= k:
+                work = greater
+                continue
+            ret += greater
+            k -= len(greater)
+            n_equal = work.count(pivot)
+            if n_equal >= k:
+                ret += [pivot] * k
+                break
+            ret += [pivot] * n_equal
+            k -= n_equal
+            work = [x for x in work if x < pivot]
+        ret.sort(reverse=True)
+        return ret
+
+
+class StreamingTopK:
+    """Running top-k of a stream in O(k) memory
+
+    Items can be pushed one at a time or fed in chunks of any iterable.
+    A min-heap of the k largest items seen so far is kept, so an incoming
+    item costs one comparison against the current threshold and, only if it
+    qualifies, one O(log k) heap replacement.
+    """
+
+    def __init__(self, k: int) -> None:
+        """Create an empty accumulator
+
+        Args:
+            k (int): Number of values to keep
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self._k = k
+        self._heap: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: int) -> None:
+        """Offer one item
+
+        Args:
+            item (int): Value to offer
+        """
+        if len(self._heap) < self._k:
+            heapq.heappush(self._heap, item)
+        elif self._k and item > self._heap[0]:
+            heapq.heapreplace(self._heap, item)
+
+    def extend(self, items: Iterable[int]) -> None:
+        """Offer every item of an iterable, e.g. one chunk of a larger feed
+
+        Args:
+            items (Iterable[int]): Values to offer
+        """
+        heap = self._heap
+        it = iter(items)
+        if len(heap) < self._k:
+            for item in it:
+                heapq.heappush(heap, item)
+                if len(heap) == self._k:
+                    break
+        if not heap:
+            return
+        for item in it:
+            if item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    def result(self) -> List[int]:
+        """Largest k values seen so far
+
+        Returns:
+            List[int]: Largest values in descending order
+        """
+        return sorted(self._heap, reverse=True)
@@ -0,0 +1,184 @@
+from collections import Counter
+from itertools import chain
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+BACKENDS = ("python", "numpy")
+
+
+class Backend:
+    """Selection of the array backend used by the control-flow kernels
+
+    ``python`` runs the reference loops. ``numpy`` runs the same reductions
+    as vectorised NumPy operations and accepts ndarrays or any object that
+    supports the buffer protocol; it pays a conversion cost on every call,
+    so it only wins on large inputs. The global default is ``python``
+    whether or not NumPy is installed; ``Backend.set("numpy")`` opts in
+    globally, and each kernel also takes a ``backend`` argument that
+    overrides the default for one call.
+    """
+
+    _default = "python"
+
+    @staticmethod
+    def available() -> tuple:
+        """Backends that can be used in this environment
+
+        Returns:
+            tuple: Names of the usable backends
+        """
+        return BACKENDS if np is not None else ("python",)
+
+    @staticmethod
+    def get() -> str:
+        """Current global backend
+
+        Returns:
+            str: Name of the backend
+        """
+        return Backend._default
+
+    @staticmethod
+    def set(name: str) -> None:
+        """Set the global backend
+
+        Args:
+            name (str): "python" or "numpy"
+        """
+        Backend._default = Backend.resolve(name)
+
+    @staticmethod
+    def resolve(name: Optional[str]) -> str:
+        """Validate a backend name, falling back to the global default
+
+        Args:
+            name (Optional[str]): Backend name, or None for the global default
+
+        Returns:
+            str: Name of the backend to use
+        """
+        if name is None:
+            return Backend._default
+        if name not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {name!r}")
+        if name == "numpy" and np is None:
+            raise ImportError("the numpy backend requires numpy to be installed")
+        return name
+
+
+class NumpyKernels:
+    """Vectorised implementations of the control-flow kernels
+
+    Each kernel returns exactly what the python backend returns for the
+    same input, as a Python scalar. Only inputs NumPy holds as fixed-width
+    integers are vectorised, and integer sums run in int64 only when the
+    result provably fits. Anything else (ragged rows, floats, ints beyond
+    64 bits, which NumPy would turn into objects or lossy floats) falls
+    back to the same reduction on Python objects.
+    """
+
+    @staticmethod
+    def sum_matrix(m: List[List[int]]) -> int:
+        """Sum of matrix of integers
+
+        Args:
+            m (List[List[int]]): Matrix of integers
+
+        Returns:
+            int: Sum of matrix of integers
+        """
+        arr = _int_array(m)
+        if arr is None:
+            return sum(chain.from_iterable(m))
+        if arr.size == 0:
+            return 0
+        bound = max(-int(arr.min()), int(arr.max())) * arr.size
+        if bound >= _INT64_LIMIT:
+            return sum(arr.ravel().tolist())
+        return int(arr.sum(dtype=np.int64))
+
+    @staticmethod
+    def count_pairs(arr: List[int]) -> int:
+        """Count values that occur exactly twice in an array
+
+        Args:
+            arr (List[int]): Array of integers
+
+        Returns:
+            int: Number of pairs in the array
+        """
+        values = _int_array(arr)
+        if values is None:
+            return sum(1 for c in Counter(arr).values() if c == 2)
+        _, counts = np.unique(values, return_counts=True)
+        return int(np.count_nonzero(counts == 2))
+
+    @staticmethod
+    def count_duplicates(arr0: List[int], arr1: List[int]) -> int:
+        """Count positions where two arrays hold the same value
+
+        Args:
+            arr0 (List[int]): Array of integers
+            arr1 (List[int]): Array of integers
+
+        Returns:
+            int: Number of duplicates between the two arrays
+        """
+        a0 = _int_array(arr0)
+        a1 = _int_array(arr1)
+        if a0 is None or a1 is None:
+            return sum(1 for x, y in zip(arr0, arr1) if x == y)
+        k = min(len(a0), len(a1))
+        return int(np.count_nonzero(a0[:k] == a1[:k]))
+
+    @staticmethod
+    def max_list(v: List[int]) -> int:
+        """Maximum value in a vector
+
+        Args:
+            v (List[int]): Vector of integers
+
+        Returns:
+            int: Maximum value in the vector
+        """
+        if len(v) == 0:
+            raise IndexError("list index out of range")
+        arr = _int_array(v)
+        if arr is None:
+            return max(v)
+        return arr.max().item()
+
+    @staticmethod
+    def sum_modulus(n: int, m: int) -> int:
+        """Sum of modulus of numbers from 0 to n
+
+        Args:
+            n (int): Number to sum up to
+            m (int): Modulus
+
+        Returns:
+            int: Sum of modulus of numbers from 0 to n
+        """
+        step = abs(m)
+        if step == 0:
+            raise ZeroDivisionError("integer division or modulo by zero")
+        terms = len(range(0, n, step))
+        if n * terms >= _INT64_LIMIT:  # the sum could overflow int64
+            return step * terms * (terms - 1) // 2
+        return np.arange(0, n, step, dtype=np.int64).sum().item()
+
+
+_INT64_LIMIT = 1 << 63
+
+
+def _int_array(values):
+    """Integer ndarray of the values, or None if NumPy cannot hold them exactly"""
+    try:
+        arr = np.asarray(values)
+    except (ValueError, OverflowError):  # ragged rows, ints beyond 64 bits
+        return None
+    return arr if arr.dtype.kind in "biu" else None
@@ -1,4 +1,7 @@
-from typing import List
+from collections import Counter
+from typing import List, Optional
+
+from llm_benchmark.control.backend import Backend, NumpyKernels
 
 
 class DoubleForLoop:
@@ -36,17 +39,20 @@ class DoubleForLoop:
         return sum_
 
     @staticmethod
-    def count_pairs(arr: List[int]) -> int:
+    def count_pairs(arr: List[int], backend: Optional[str] = None) -> int:
         """Count pairs of numbers in an array
 
         A pair is defined as exactly two numbers in the array that are equal.
 
         Args:
             arr (List[int]): Array of integers
+            backend (Optional[str]): "python" or "numpy", see Backend
 
         Returns:
             int: Number of pairs in the array
         """
+        if Backend.resolve(backend) == "numpy":
+            return NumpyKernels.count_pairs(arr)
         count = 0
         for i in range(len(arr)):
             ndup = 0
@@ -59,16 +65,21 @@ class DoubleForLoop:
         return count // 2
 
     @staticmethod
-    def count_duplicates(arr0: List[int], arr1: List[int]) -> int:
+    def count_duplicates(
+        arr0: List[int], arr1: List[int], backend: Optional[str] = None
+    ) -> int:
         """Count duplicates between two arrays
 
         Args:
             arr0 (List[int]): Array of integers
             arr1 (List[int]): Array of integers
+            backend (Optional[str]): "python" or "numpy", see Backend
 
         Returns:
             int: Number of duplicates between the two arrays
         """
+        if Backend.resolve(backend) == "numpy":
+            return NumpyKernels.count_duplicates(arr0, arr1)
         count = 0
         for i in range(len(arr0)):
             for j in range(len(arr1)):
@@ -77,17 +88,94 @@ class DoubleForLoop:
         return count
 
     @staticmethod
-    def sum_matrix(m: List[List[int]]) -> int:
+    def sum_matrix(m: List[List[int]], backend: Optional[str] = None) -> int:
         """Sum of matrix of integers
 
         Args:
             m (List[List[int]]): Matrix of integers
+            backend (Optional[str]): "python" or "numpy", see Backend
 
         Returns:
             int: Sum of matrix of integers
         """
+        if Backend.resolve(backend) == "numpy":
+            return NumpyKernels.sum_matrix(m)
         sum_ = 0
         for i in range(len(m)):
             for j in range(len(m[i])):
                 sum_ += m[i][j]
         return sum_
+
+
+class DoubleForLoopOptimized:
+    """Closed-form and single-pass versions of the DoubleForLoop kernels
+
+    Each method returns exactly what its DoubleForLoop counterpart returns.
+    """
+
+    @staticmethod
+    def sum_square(n: int) -> int:
+        """Sum of squares of numbers from 0 to n (exclusive)
+
+        Args:
+            n (int): Number to sum up to
+
+        Returns:
+            int: Sum of squares of numbers from 0 to n
+        """
+        if n <= 0:
+            return 0
+        return (n - 1) * n * (2 * n - 1) // 6
+
+    @staticmethod
+    def sum_triangle(n: int) -> int:
+        """Sum of triangle of numbers from 0 to n (exclusive)
+
+        Args:
+            n (int): Number to sum up to
+
+        Returns:
+            int: Sum of triangle of numbers from 0 to n
+        """
+        if n <= 0:
+            return 0
+        return (n - 1) * n * (n + 1) // 6
+
+    @staticmethod
+    def count_pairs(arr: List[int]) -> int:
+        """Count pairs of numbers in an array
+
+        A pair is defined as exactly two numbers in the array that are equal.
+
+        Args:
+            arr (List[int]): Array of integers
+
+        Returns:
+            int: Number of pairs in the array
+        """
+        return sum(1 for c in Counter(arr).values() if c == 2)
+
+    @staticmethod
+    def count_duplicates(arr0: List[int], arr1: List[int]) -> int:
+        """Count duplicates between two arrays
+
+        Args:
+            arr0 (List[int]): Array of integers
+            arr1 (List[int]): Array of integers
+
+        Returns:
+            int: Number of duplicates between the two arrays
+        """
+        return sum(a == b for a, b in zip(arr0, arr1))
+
+    @staticmethod
+    def sum_matrix(m: List[List[int]]) -> int:
+        """Sum of matrix of integers
+
+        Args:
+            m (List[List[int]]): Matrix of integers
+
+        Returns:
+            int: Sum of matrix of integers
+        """
+        return sum(map(sum, m))
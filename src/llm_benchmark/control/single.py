@@ -1,4 +1,6 @@
-from typing import List
+from typing import Callable, List, Optional
+
+from llm_benchmark.control.backend import Backend, NumpyKernels
 
 
 class SingleForLoop:
@@ -18,15 +20,18 @@ class SingleForLoop:
         return sum(arr)
 
     @staticmethod
-    def max_list(v: List[int]) -> int:
+    def max_list(v: List[int], backend: Optional[str] = None) -> int:
         """Maximum value in a vector
 
         Args:
             v (List[int]): Vector of integers
+            backend (Optional[str]): "python" or "numpy", see Backend
 
         Returns:
             int: Maximum value in the vector
         """
+        if Backend.resolve(backend) == "numpy":
+            return NumpyKernels.max_list(v)
         max_val = v[0]
         for i in range(1, len(v)):
             if v[i] > max_val:
@@ -34,18 +39,78 @@ class SingleForLoop:
         return max_val
 
     @staticmethod
-    def sum_modulus(n: int, m: int) -> int:
+    def sum_modulus(n: int, m: int, backend: Optional[str] = None) -> int:
         """Sum of modulus of numbers from 0 to n
 
         Args:
             n (int): Number to sum up to
             m (int): Modulus
+            backend (Optional[str]): "python" or "numpy", see Backend
 
         Returns:
             int: Sum of modulus of numbers from 0 to n
         """
+        if Backend.resolve(backend) == "numpy":
+            return NumpyKernels.sum_modulus(n, m)
         arr = []
         for i in range(n):
             if i % m == 0:
                 arr.append(i)
         return sum(arr)
+
+
+class SingleForLoopOptimized:
+    """Constant-memory versions of the SingleForLoop range reductions
+
+    Nothing is materialised, so n may be arbitrarily large, including
+    beyond 2**63.
+    """
+
+    @staticmethod
+    def sum_range(n: int) -> int:
+        """Sum of range of numbers from 0 to n
+
+        Args:
+            n (int): Number to sum up to
+
+        Returns:
+            int: Sum of range of numbers from 0 to n
+        """
+        if n <= 0:
+            return 0
+        return n * (n - 1) // 2
+
+    @staticmethod
+    def sum_modulus(n: int, m: int) -> int:
+        """Sum of modulus of numbers from 0 to n
+
+        Args:
+            n (int): Number to sum up to
+            m (int): Modulus
+
+        Returns:
+            int: Sum of modulus of numbers from 0 to n
+        """
+        step = abs(m)
+        if step == 0:
+            raise ZeroDivisionError("integer division or modulo by zero")
+        if n <= 0:
+            return 0
+        k = (n - 1) // step  # largest multiple below n is k * step
+        return step * k * (k + 1) // 2
+
+    @staticmethod
+    def sum_where(n: int, predicate: Callable[[int], bool]) -> int:
+        """Sum of numbers from 0 to n for which a predicate holds
+
+        The range is consumed lazily, so memory stays constant for any n;
+        time is still linear in n.
+
+        Args:
+            n (int): Number to sum up to
+            predicate (Callable[[int], bool]): Filter applied to each number
+
+        Returns:
+            int: Sum of the matching numbers from 0 to n
+        """
+        return sum(filter(predicate, range(n)))
@@ -1,34 +1,44 @@
 from typing import List
 
+from llm_benchmark.algorithms.sort_engine import SortEngine
+from llm_benchmark.datastructures.intarray import IntArray, IntList
+from llm_benchmark.datastructures.pipeline import ListPipeline
+from llm_benchmark.datastructures.search_index import SearchIndex
+from llm_benchmark.datastructures.views import ChainView, ReversedView, RotatedView
+
 
 class DsList:
     @staticmethod
-    def modify_list(v: List[int]) -> List[int]:
+    def modify_list(v: IntList) -> IntList:
         """Modify a list by adding 1 to each element
 
         Args:
-            v (List[int]): List of integers
+            v (IntList): List of integers
 
         Returns:
-            List[int]: Modified list of integers
+            IntList: Modified list of integers, an IntArray for an IntArray
         """
+        if isinstance(v, IntArray):
+            return IntArray(map((1).__add__, v))
         ret = []
         for i in range(len(v)):
             ret.append(v[i] + 1)
         return ret
 
     @staticmethod
-    def search_list(v: List[int], n: int) -> List[int]:
+    def search_list(v: IntList, n: int) -> List[int]:
         """Search a list for a value, returning a list
         of indices where the value is found
 
         Args:
-            v (List[int]): List of integers
+            v (IntList): List of integers
             n (int): Value to search for
 
         Returns:
             List[int]: List of indices where the value is found
         """
+        if isinstance(v, IntArray):
+            return v.find_all(n)
         ret = []
         for i in range(len(v)):
             if v[i] == n:
@@ -36,49 +46,76 @@ class DsList:
         return ret
 
     @staticmethod
-    def sort_list(v: List[int]) -> List[int]:
-        """Sort a list of integers, returns a copy
+    def search_index(v: IntList) -> SearchIndex:
+        """Index a list for repeated value lookups
 
         Args:
-            v (List[int]): List of integers
+            v (IntList): List of integers
 
         Returns:
-            List[int]: Sorted list of integers
+            SearchIndex: Index answering the same queries as search_list
         """
-        ret = v.copy()
-        for i in range(len(ret)):
-            for j in range(i + 1, len(ret)):
-                if ret[i] > ret[j]:
-                    ret[i], ret[j] = ret[j], ret[i]
+        return SearchIndex(v)
 
-        return ret
+    @staticmethod
+    def sort_list(v: IntList, strategy: str = "auto") -> IntList:
+        """Sort a list of integers, returns a copy
+
+        Args:
+            v (IntList): List of integers
+            strategy (str): Sort strategy, see SortEngine
+
+        Returns:
+            IntList: Sorted list of integers, an IntArray for an IntArray
+        """
+        if isinstance(v, IntArray):
+            return IntArray(SortEngine.sorted_copy(v, strategy))
+        return SortEngine.sorted_copy(v, strategy)
 
     @staticmethod
-    def reverse_list(v: List[int]) -> List[int]:
+    def reverse_list(v: IntList) -> IntList:
         """Reverse a list of integers, returns a copy
 
         Args:
-            v (List[int]): List of integers
+            v (IntList): List of integers
 
         Returns:
-            List[int]: Reversed list of integers
+            IntList: Reversed list of integers, an IntArray for an IntArray
         """
+        if isinstance(v, IntArray):
+            ret = IntArray(v)
+            ret.reverse()
+            return ret
         ret = []
         for i in range(len(v)):
             ret.append(v[len(v) - 1 - i])
         return ret
 
     @staticmethod
-    def rotate_list(v: List[int], n: int) -> List[int]:
+    def reverse_view(v: IntList) -> ReversedView:
+        """Reverse a list of integers without copying it
+
+        Args:
+            v (IntList): List of integers
+
+        Returns:
+            ReversedView: Reversed view of the list
+        """
+        return ReversedView(v)
+
+    @staticmethod
+    def rotate_list(v: IntList, n: int) -> IntList:
         """Rotate a list of integers by n positions
 
         Args:
-            v (List[int]): List of integers
+            v (IntList): List of integers
             n (int): Number of positions to rotate
 
         Returns:
-            List[int]: Rotated list of integers
+            IntList: Rotated list of integers, an IntArray for an IntArray
         """
+        if isinstance(v, IntArray):
+            return v[n:] + v[:n]
         ret = []
         for i in range(n, len(v)):
             ret.append(v[i])
@@ -87,19 +124,61 @@ class DsList:
         return ret
 
     @staticmethod
-    def merge_lists(v1: List[int], v2: List[int]) -> List[int]:
+    def rotate_view(v: IntList, n: int) -> RotatedView:
+        """Rotate a list of integers by n positions without copying it
+
+        Args:
+            v (IntList): List of integers
+            n (int): Number of positions to rotate
+
+        Returns:
+            RotatedView: Rotated view of the list
+        """
+        return RotatedView(v, n)
+
+    @staticmethod
+    def merge_lists(v1: IntList, v2: IntList) -> IntList:
         """Merge two lists of integers, returns a copy
 
         Args:
-            v1 (List[int]): First list of integers
-            v2 (List[int]): Second list of integers
+            v1 (IntList): First list of integers
+            v2 (IntList): Second list of integers
 
         Returns:
-            List[int]: Merged list of integers
+            IntList: Merged list of integers, an IntArray if either input is one
         """
+        if isinstance(v1, IntArray) or isinstance(v2, IntArray):
+            ret = IntArray(v1)
+            ret.extend(v2)
+            return ret
         ret = []
         for i in range(len(v1)):
             ret.append(v1[i])
         for i in range(len(v2)):
             ret.append(v2[i])
         return ret
+
+    @staticmethod
+    def merge_view(v1: IntList, v2: IntList) -> ChainView:
+        """Merge two lists of integers without copying them
+
+        Args:
+            v1 (IntList): First list of integers
+            v2 (IntList): Second list of integers
+
+        Returns:
+            ChainView: View of v1 followed by v2
+        """
+        return ChainView(v1, v2)
+
+    @staticmethod
+    def pipeline(v: IntList) -> ListPipeline:
+        """Start a lazy chain of list operations
+
+        Args:
+            v (IntList): List of integers
+
+        Returns:
+            ListPipeline: Pipeline reading from the list
+        """
+        return ListPipeline(v)
@@ -0,0 +1,106 @@
+import re
+import struct
+from array import array
+from typing import Iterable, List, Union
+
+TYPECODE = "q"
+_PACK = struct.Struct("=" + TYPECODE).pack
+
+
+class IntArray(array):
+    """Compact list of signed 64-bit integers
+
+    An ``array('q')`` holds each element in 8 bytes instead of a pointer to
+    an int object, and exposes the buffer protocol, so it can be handed to
+    ``memoryview``, ``numpy.frombuffer`` or ``file.write`` without
+    conversion. Slicing, concatenation and repetition return ``IntArray``,
+    copying the elements once; extended slices (step other than 1) go
+    through an intermediate ``array``.
+    """
+
+    __slots__ = ()
+
+    # find_all stops searching the buffer and compares the remaining
+    # elements one by one once more than 1 in DENSE_RATIO of them match
+    DENSE_RATIO = 8
+
+    def __new__(cls, values: Iterable[int] = ()) -> "IntArray":
+        return super().__new__(cls, TYPECODE, values)
+
+    def __getitem__(self, i):
+        if not isinstance(i, slice):
+            return super().__getitem__(i)
+        start, stop, step = i.indices(len(self))
+        if step != 1:
+            return IntArray(super().__getitem__(i))
+        ret = IntArray()
+        if start < stop:
+            width = self.itemsize
+            with memoryview(self) as view:
+                ret.frombytes(view.cast("B")[start * width : stop * width])
+        return ret
+
+    # ``ret += other`` and ``ret *= n`` would dispatch back to the overrides
+    # below, so the in-place array methods are called explicitly
+    def __add__(self, other: array) -> "IntArray":
+        ret = IntArray(self)
+        array.__iadd__(ret, other)
+        return ret
+
+    def __mul__(self, n: int) -> "IntArray":
+        ret = IntArray(self)
+        array.__imul__(ret, n)
+        return ret
+
+    __rmul__ = __mul__
+
+    def __copy__(self) -> "IntArray":
+        return IntArray(self)
+
+    def __deepcopy__(self, memo) -> "IntArray":
+        return IntArray(self)
+
+    def __repr__(self) -> str:
+        return f"IntArray({self.tolist()!r})"
+
+    def find_all(self, n: int) -> List[int]:
+        """Indices of every element equal to a value
+
+        Searches the buffer in place with a literal regular expression, so
+        the scan runs in C without copying the elements; matches that do not
+        start on an element boundary are skipped. Each match costs a call
+        back into Python, so once matches are dense the rest of the array is
+        compared element by element instead.
+
+        Args:
+            n (int): Value to search for
+
+        Returns:
+            List[int]: Indices where the value is found, ascending
+        """
+        try:
+            pattern = _PACK(n)
+        except struct.error:  # out of int64 range, cannot be present
+            return []
+        search = re.compile(re.escape(pattern)).search
+        width = self.itemsize
+        ret = []
+        with memoryview(self) as view:
+            match = search(view)
+            while match:
+                pos = match.start()
+                if pos % width == 0:
+                    i = pos // width
+                    ret.append(i)
+                    if len(ret) >= 64 and len(ret) * self.DENSE_RATIO > i:
+                        rest = enumerate(self[i + 1 :].tolist(), i + 1)
+                        ret += [j for j, x in rest if x == n]
+                        break
+                    match = search(view, pos + width)
+                else:
+                    match = search(view, pos + 1)
+        return ret
+
+
+# Integer sequences accepted by DsList
+IntList = Union[List[int], IntArray]
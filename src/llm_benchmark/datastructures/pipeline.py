@@ -0,0 +1,194 @@
+from bisect import bisect_right
+from itertools import chain
+from typing import Callable, Iterator, List, Sequence, Tuple, Union
+
+from llm_benchmark.algorithms.sort_engine import SortEngine
+from llm_benchmark.datastructures.intarray import IntList
+
+# An elementwise step: an int adds that constant, a callable is applied
+_Step = Union[int, Callable[[int], int]]
+
+
+class ListPipeline:
+    """Lazy chain of ``DsList`` operations, evaluated in one pass
+
+    Steps are recorded instead of executed. Index remaps (``reverse``,
+    ``rotate``, ``merge``) are folded into a list of ranges over the
+    concatenated inputs, and elementwise maps (``modify``, ``map``) into a
+    per-input chain of functions, with consecutive ``modify`` steps merged
+    into a single addition. :meth:`to_list` then builds the output list
+    directly from the inputs, so no intermediate list is allocated;
+    iterating the pipeline streams the same values without building any
+    list at all.
+
+    ``sort`` needs every value at once, so it materialises the pipeline and
+    starts a new one from the sorted list.
+
+    Builder methods modify the pipeline and return it, for chaining. The
+    inputs are read when the pipeline is evaluated, not when it is built.
+    """
+
+    def __init__(self, v: IntList) -> None:
+        """Start a pipeline from a list
+
+        Args:
+            v (IntList): List of integers
+        """
+        self._parts: List[Tuple[Sequence[int], List[_Step]]] = []
+        self._starts: List[int] = [0]
+        self._rows: List[range] = []
+        self._add_part(v, [])
+
+    def __len__(self) -> int:
+        return sum(map(len, self._rows))
+
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(self._pieces())
+
+    def modify(self) -> "ListPipeline":
+        """Add 1 to each element, like ``DsList.modify_list``
+
+        Returns:
+            ListPipeline: This pipeline
+        """
+        for _, steps in self._parts:
+            if steps and isinstance(steps[-1], int):
+                steps[-1] += 1
+            else:
+                steps.append(1)
+        return self
+
+    def map(self, fn: Callable[[int], int]) -> "ListPipeline":
+        """Apply a function to each element
+
+        Args:
+            fn (Callable[[int], int]): Function to apply
+
+        Returns:
+            ListPipeline: This pipeline
+        """
+        for _, steps in self._parts:
+            steps.append(fn)
+        return self
+
+    def reverse(self) -> "ListPipeline":
+        """Reverse the list, like ``DsList.reverse_list``
+
+        Returns:
+            ListPipeline: This pipeline
+        """
+        self._rows = [r[::-1] for r in reversed(self._rows)]
+        return self
+
+    def rotate(self, n: int) -> "ListPipeline":
+        """Rotate the list by n positions, like ``DsList.rotate_list``
+
+        Args:
+            n (int): Number of positions to rotate, may be negative
+
+        Returns:
+            ListPipeline: This pipeline
+        """
+        size = len(self)
+        if size:
+            n %= size
+            self._rows = _cut(self._rows, n, size) + _cut(self._rows, 0, n)
+        return self
+
+    def merge(self, other: Union[IntList, "ListPipeline"]) -> "ListPipeline":
+        """Append another list or pipeline, like ``DsList.merge_lists``
+
+        Args:
+            other (Union[IntList, ListPipeline]): Values to append
+
+        Returns:
+            ListPipeline: This pipeline
+        """
+        if not isinstance(other, ListPipeline):
+            self._add_part(other, [])
+            return self
+        offset = self._starts[-1]
+        parts, rows = list(other._parts), list(other._rows)  # other may be self
+        for v, steps in parts:
+            self._parts.append((v, list(steps)))
+            self._starts.append(self._starts[-1] + len(v))
+        for r in rows:
+            self._rows.append(range(r.start + offset, r.stop + offset, r.step))
+        return self
+
+    def sort(self, strategy: str = "auto") -> "ListPipeline":
+        """Sort the list, like ``DsList.sort_list``
+
+        Materialises the steps recorded so far.
+
+        Args:
+            strategy (str): Sort strategy, see SortEngine
+
+        Returns:
+            ListPipeline: This pipeline
+        """
+        v = self.to_list()
+        SortEngine.sort(v, strategy)
+        self._parts, self._starts, self._rows = [], [0], []
+        self._add_part(v, [])
+        return self
+
+    def to_list(self) -> List[int]:
+        """Evaluate the pipeline into a new list
+
+        Returns:
+            List[int]: Result of all recorded steps
+        """
+        ret: List[int] = []
+        for piece in self._pieces():
+            ret.extend(piece)
+        return ret
+
+    def stream(self) -> Iterator[int]:
+        """Evaluate the pipeline lazily
+
+        Returns:
+            Iterator[int]: Generator of the result values, in order
+        """
+        yield from self
+
+    def _add_part(self, v: Sequence[int], steps: List[_Step]) -> None:
+        start = self._starts[-1]
+        self._parts.append((v, steps))
+        self._starts.append(start + len(v))
+        if len(v):
+            self._rows.append(range(start, start + len(v)))
+
+    def _pieces(self) -> Iterator[Iterator[int]]:
+        """One iterator per run of output that reads a single input"""
+        starts = self._starts
+        for r in self._rows:
+            if not r:
+                continue
+            lo, hi = min(r[0], r[-1]), max(r[0], r[-1]) + 1
+            p = bisect_right(starts, lo) - 1
+            runs = []
+            while lo < hi:
+                stop = min(hi, starts[p + 1])
+                runs.append((p, range(lo - starts[p], stop - starts[p])))
+                lo, p = stop, p + 1
+            if r.step < 0:
+                runs = [(p, local[::-1]) for p, local in reversed(runs)]
+            for p, local in runs:
+                v, steps = self._parts[p]
+                it = map(v.__getitem__, local)
+                for step in steps:
+                    it = map(step.__add__ if isinstance(step, int) else step, it)
+                yield it
+
+
+def _cut(rows: List[range], start: int, stop: int) -> List[range]:
+    """Sub-list of ranges covering output positions [start, stop)"""
+    ret = []
+    pos = 0
+    for r in rows:
+        lo, hi = max(start - pos, 0), min(stop - pos, len(r))
+        if lo < hi:
+            ret.append(r[lo:hi])
+        pos += len(r)
+    return ret
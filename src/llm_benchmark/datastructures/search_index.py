@@ -0,0 +1,170 @@
+from array import array
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Dict, List, Union
+
+from llm_benchmark.datastructures.intarray import IntList
+
+# A value seen once maps to its position; repeated values map to an ascending
+# array of positions
+_Positions = Union[int, array]
+
+
+class SearchIndex:
+    """Value to positions index over a list, built once and kept up to date
+
+    Lookups cost one hash probe plus the size of the answer, instead of the
+    full scan ``DsList.search_list`` does. The index keeps a reference to
+    the list: changes must go through :meth:`append` and :meth:`modify`, or
+    the index goes stale.
+
+    The index also tracks whether the list is sorted, so that
+    :meth:`positions_between` can answer range queries with two binary
+    searches instead of looking at every distinct value.
+    """
+
+    def __init__(self, v: IntList) -> None:
+        """Index a list
+
+        Args:
+            v (IntList): List of integers
+        """
+        self._values = v
+        self._index: Dict[int, _Positions] = {}
+        index = self._index
+        for i, x in enumerate(v):
+            p = index.get(x)
+            if p is None:
+                index[x] = i
+            elif isinstance(p, int):
+                index[x] = array("q", (p, i))
+            else:
+                p.append(i)
+        # Number of adjacent pairs out of order; the list is sorted when zero
+        self._descents = sum(a > b for a, b in zip(v, islice(v, 1, None)))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: int) -> bool:
+        return value in self._index
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether the list is in ascending order"""
+        return self._descents == 0
+
+    def positions(self, value: int) -> List[int]:
+        """Indices where a value is found
+
+        Args:
+            value (int): Value to search for
+
+        Returns:
+            List[int]: Indices where the value is found, ascending
+        """
+        p = self._index.get(value)
+        if p is None:
+            return []
+        if isinstance(p, int):
+            return [p]
+        return p.tolist()
+
+    def count(self, value: int) -> int:
+        """Number of occurrences of a value
+
+        Args:
+            value (int): Value to count
+
+        Returns:
+            int: Number of occurrences
+        """
+        p = self._index.get(value)
+        if p is None:
+            return 0
+        return 1 if isinstance(p, int) else len(p)
+
+    def positions_between(self, lo: int, hi: int) -> List[int]:
+        """Indices of the values v with lo <= v < hi
+
+        Uses binary search on the list when it is sorted, and the index
+        otherwise.
+
+        Args:
+            lo (int): Smallest value, inclusive
+            hi (int): Largest value, exclusive
+
+        Returns:
+            List[int]: Matching indices, ascending
+        """
+        if self.is_sorted:
+            v = self._values
+            return list(range(bisect_left(v, lo), bisect_left(v, hi)))
+        ret: List[int] = []
+        for value, p in self._index.items():
+            if lo <= value < hi:
+                if isinstance(p, int):
+                    ret.append(p)
+                else:
+                    ret.extend(p)
+        ret.sort()
+        return ret
+
+    def append(self, value: int) -> None:
+        """Append a value to the list and the index
+
+        Args:
+            value (int): Value to append
+        """
+        v = self._values
+        if v and v[-1] > value:
+            self._descents += 1
+        v.append(value)
+        self._insert(value, len(v) - 1)
+
+    def modify(self, i: int, value: int) -> None:
+        """Set ``v[i] = value`` in the list and the index
+
+        Args:
+            i (int): Index to set, may be negative
+            value (int): New value
+        """
+        v = self._values
+        i = range(len(v))[i]
+        old = v[i]
+        if old == value:
+            return
+        self._descents -= self._descents_around(i)
+        v[i] = value
+        self._descents += self._descents_around(i)
+        self._remove(old, i)
+        self._insert(value, i)
+
+    def _descents_around(self, i: int) -> int:
+        v = self._values
+        d = 0
+        if i > 0 and v[i - 1] > v[i]:
+            d += 1
+        if i + 1 < len(v) and v[i] > v[i + 1]:
+            d += 1
+        return d
+
+    def _insert(self, value: int, i: int) -> None:
+        p = self._index.get(value)
+        if p is None:
+            self._index[value] = i
+        elif isinstance(p, int):
+            self._index[value] = array("q", (p, i) if p < i else (i, p))
+        elif i > p[-1]:
+            p.append(i)
+        else:
+            insort(p, i)
+
+    def _remove(self, value: int, i: int) -> None:
+        p = self._index[value]
+        if isinstance(p, int):
+            del self._index[value]
+            return
+        del p[bisect_left(p, i)]
+        if len(p) == 1:
+            self._index[value] = p[0]
@@ -0,0 +1,164 @@
+from abc import abstractmethod
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import chain
+from typing import Iterator, List, Optional, Sequence as SequenceT
+
+
+class ListView(Sequence):
+    """Read-only view over one or more sequences, without copying them
+
+    A view maps its positions ``rows`` onto the underlying storage. Slicing
+    returns a view of the same kind over a sub-range of ``rows``, so no
+    element is copied until :meth:`to_list` is called. The underlying
+    sequences are referenced, not snapshotted: writes to them show through,
+    but the length of a view is fixed when it is created.
+
+    Subclasses implement :meth:`_at` and :meth:`_view`.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: range) -> None:
+        self._rows = rows
+
+    @abstractmethod
+    def _at(self, j: int) -> int:
+        """Element at storage position ``j``"""
+
+    @abstractmethod
+    def _view(self, rows: range) -> "ListView":
+        """View of the same kind over the storage positions ``rows``"""
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._view(self._rows[i])
+        return self._at(self._rows[i])
+
+    def __iter__(self) -> Iterator[int]:
+        return map(self._at, self._rows)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (ListView, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_list()!r})"
+
+    def to_list(self) -> List[int]:
+        """Materialise the view as a new list
+
+        Returns:
+            List[int]: Elements of the view, in order
+        """
+        return list(self)
+
+
+class ReversedView(ListView):
+    """View of a sequence in reverse order"""
+
+    __slots__ = ("_base",)
+
+    def __init__(self, base: SequenceT[int], rows: Optional[range] = None) -> None:
+        """Reverse a sequence
+
+        Args:
+            base (Sequence[int]): Sequence to view
+            rows (Optional[range]): Positions of the view into ``base``
+        """
+        super().__init__(range(len(base) - 1, -1, -1) if rows is None else rows)
+        self._base = base
+
+    def _at(self, j: int) -> int:
+        return self._base[j]
+
+    def _view(self, rows: range) -> "ReversedView":
+        return ReversedView(self._base, rows)
+
+    def __iter__(self) -> Iterator[int]:
+        return map(self._base.__getitem__, self._rows)
+
+
+class RotatedView(ListView):
+    """View of a sequence rotated left by ``offset`` positions
+
+    Position ``i`` of the view is ``base[(i + offset) % len(base)]``, which
+    matches ``DsList.rotate_list(base, offset)``.
+    """
+
+    __slots__ = ("_base", "_offset")
+
+    def __init__(
+        self, base: SequenceT[int], offset: int, rows: Optional[range] = None
+    ) -> None:
+        """Rotate a sequence
+
+        Args:
+            base (Sequence[int]): Sequence to view
+            offset (int): Number of positions to rotate by, may be negative
+            rows (Optional[range]): Positions of the view, before rotation
+        """
+        super().__init__(range(len(base)) if rows is None else rows)
+        self._base = base
+        self._offset = offset % len(base) if len(base) else 0
+
+    def _at(self, j: int) -> int:
+        j += self._offset
+        n = len(self._base)
+        return self._base[j - n if j >= n else j]
+
+    def _view(self, rows: range) -> "RotatedView":
+        return RotatedView(self._base, self._offset, rows)
+
+    def __iter__(self) -> Iterator[int]:
+        rows = self._rows
+        if rows.step == 1:
+            # Two contiguous runs of the base; iterate them directly
+            n, k = len(self._base), self._offset
+            lo, hi = rows.start + k, rows.stop + k
+            if hi <= n or lo >= n:
+                shift = n if lo >= n else 0
+                return map(self._base.__getitem__, range(lo - shift, hi - shift))
+            return chain(
+                map(self._base.__getitem__, range(lo, n)),
+                map(self._base.__getitem__, range(0, hi - n)),
+            )
+        return super().__iter__()
+
+
+class ChainView(ListView):
+    """View of several sequences one after the other"""
+
+    __slots__ = ("_parts", "_starts")
+
+    def __init__(
+        self, *parts: SequenceT[int], rows: Optional[range] = None
+    ) -> None:
+        """Concatenate sequences
+
+        Args:
+            *parts (Sequence[int]): Sequences to view, in order
+            rows (Optional[range]): Positions of the view into the chain
+        """
+        starts = [0]
+        for part in parts:
+            starts.append(starts[-1] + len(part))
+        super().__init__(range(starts[-1]) if rows is None else rows)
+        self._parts = parts
+        self._starts = starts
+
+    def _at(self, j: int) -> int:
+        p = bisect_right(self._starts, j) - 1
+        return self._parts[p][j - self._starts[p]]
+
+    def _view(self, rows: range) -> "ChainView":
+        return ChainView(*self._parts, rows=rows)
+
+    def __iter__(self) -> Iterator[int]:
+        if self._rows == range(self._starts[-1]):
+            return chain.from_iterable(self._parts)
+        return super().__iter__()
@@ -1,30 +1,173 @@
-from random import randint
-from typing import List
+import struct
+from array import array
+from random import Random
+from typing import Iterator, List, Sequence, Union
+
+from llm_benchmark.control.backend import Backend, np
+from llm_benchmark.datastructures.intarray import IntArray
+
+# A seed for reproducible output, a Random instance to draw from, or None for
+# a fresh unseeded generator
+Seed = Union[None, int, Random]
+
+CHUNK_SIZE = 1 << 16
+
+
+def _random(seed: Seed) -> Random:
+    return seed if isinstance(seed, Random) else Random(seed)
+
+
+def _numpy_generator(seed: Seed):
+    if isinstance(seed, Random):
+        seed = seed.getrandbits(128)
+    return np.random.default_rng(seed)
+
+
+class _Sampler:
+    """Uniform integers in [0, m), drawn from a Random in bulk
+
+    Draws raw machine words with one getrandbits call and rejects the words
+    at or above the largest multiple of m they can hold, so every value is
+    exactly equally likely. For m <= 256 the words are single bytes and
+    both steps run inside ``bytes.translate``.
+
+    Whole 32-bit outputs of the generator are always consumed and accepted
+    values not yet asked for are kept for the next call, so the values only
+    depend on the seed: taking n values in several calls gives the same
+    values as taking them in one. Words are decoded little-endian with
+    fixed 4- or 8-byte sizes, so the values are the same on every host.
+    """
+
+    def __init__(self, rng: Random, m: int) -> None:
+        if m <= 0:
+            raise ValueError(f"m must be positive, got {m}")
+        self._rng = rng
+        self._m = m
+        self._pending = bytearray()
+        if m <= 1 << 8:
+            self._table = bytes(b % m for b in range(256))
+            self._rejected = bytes(range(256 // m * m, 256))
+        elif m <= 1 << 64:
+            self._format = "I" if m <= 1 << 32 else "Q"
+            self._width = struct.calcsize("<" + self._format)
+            self._limit = (1 << 8 * self._width) // m * m
+
+    def take(self, n: int) -> Sequence[int]:
+        m, rng = self._m, self._rng
+        if m <= 1 << 8:
+            pending = self._pending
+            while len(pending) < n:
+                k = -(-(n - len(pending)) // 4) * 4
+                raw = rng.getrandbits(8 * k).to_bytes(k, "little")
+                pending += raw.translate(self._table, self._rejected)
+            ret = array("B", pending[:n])
+            del pending[:n]
+            return ret
+        if m > 1 << 64:
+            return [rng.randrange(m) for _ in range(n)]
+        width, limit = self._width, self._limit
+        ret: List[int] = []
+        while len(ret) < n:
+            k = n - len(ret)
+            raw = rng.getrandbits(8 * width * k).to_bytes(width * k, "little")
+            words = struct.unpack(f"<{k}{self._format}", raw)
+            ret += [w % m for w in words if w < limit]
+        return ret
 
 
 class GenList:
     @staticmethod
-    def random_list(n: int, m: int) -> List[int]:
+    def random_list(n: int, m: int, seed: Seed = None) -> List[int]:
         """Generate a list of random integers
 
         Args:
             n (int): Number of integers to generate
             m (int): Maximum value of integers (exclusive)
+            seed (Seed): Seed or Random instance, None for unseeded
 
         Returns:
             List[int]: List of random integers
         """
-        return [randint(0, m) for _ in range(n)]
+        if n <= 0:
+            return []
+        return list(_Sampler(_random(seed), m).take(n))
 
     @staticmethod
-    def random_matrix(n: int, m: int) -> List[List[int]]:
+    def random_matrix(n: int, m: int, seed: Seed = None) -> List[List[int]]:
         """Generate a matrix of random integers
 
+        Values are in [0, m).
+
         Args:
             n (int): Number of rows
             m (int): Number of columns
+            seed (Seed): Seed or Random instance, None for unseeded
 
         Returns:
             List[List[int]]: Matrix of random integers
         """
-        return [GenList.random_list(n, m) for _ in range(n)]
+        rng = _random(seed)
+        return [GenList.random_list(m, m, rng) for _ in range(n)]
+
+    @staticmethod
+    def random_array(n: int, m: int, seed: Seed = None, backend: str = "python"):
+        """Generate a compact array of random integers
+
+        Args:
+            n (int): Number of integers to generate
+            m (int): Maximum value of integers (exclusive)
+            seed (Seed): Seed or Random instance, None for unseeded
+            backend (str): "python", or "numpy" to draw with NumPy's
+                generator instead
+
+        Returns:
+            IntArray | numpy.ndarray: Random integers, as an int64 ndarray
+                with the numpy backend
+        """
+        if Backend.resolve(backend) == "numpy":
+            return _numpy_generator(seed).integers(0, m, size=max(n, 0))
+        if n <= 0:
+            return IntArray()
+        return IntArray(_Sampler(_random(seed), m).take(n))
+
+    @staticmethod
+    def random_chunks(
+        n: int,
+        m: int,
+        chunk_size: int = CHUNK_SIZE,
+        seed: Seed = None,
+        backend: str = "python",
+    ) -> Iterator:
+        """Generate random integers in fixed-size chunks
+
+        Only one chunk is held in memory at a time, so n can exceed what fits
+        in memory. With the python backend the concatenated chunks equal
+        ``random_array(n, m, seed)`` for any chunk size.
+
+        Args:
+            n (int): Number of integers to generate
+            m (int): Maximum value of integers (exclusive)
+            chunk_size (int): Number of integers per chunk, the last may be
+                shorter
+            seed (Seed): Seed or Random instance, None for unseeded
+            backend (str): "python", or "numpy" to draw with NumPy's
+                generator instead
+
+        Returns:
+            Iterator: Generator of IntArray chunks, ndarrays with numpy
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if Backend.resolve(backend) == "numpy":
+            return _numpy_chunks(n, m, chunk_size, _numpy_generator(seed))
+        return _chunks(n, chunk_size, _Sampler(_random(seed), m))
+
+
+def _chunks(n: int, chunk_size: int, sampler: _Sampler) -> Iterator[IntArray]:
+    for start in range(0, n, chunk_size):
+        yield IntArray(sampler.take(min(chunk_size, n - start)))
+
+
+def _numpy_chunks(n: int, m: int, chunk_size: int, gen) -> Iterator:
+    for start in range(0, n, chunk_size):
+        yield gen.integers(0, m, size=min(chunk_size, n - start))
@@ -0,0 +1,190 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, Optional, TypeVar
+
+from llm_benchmark.sql.pool import ConnectionPool
+from llm_benchmark.sql.query import SqlQuery
+
+T = TypeVar("T")
+
+
+class _Call:
+    """Connection in use by one executor call, so it can be interrupted"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.conn = None
+        self.cancelled = False
+
+    def interrupt(self) -> None:
+        with self.lock:
+            self.cancelled = True
+            if self.conn is not None:
+                self.conn.interrupt()
+
+
+class AsyncSqlQuery:
+    """Coroutine versions of the SqlQuery methods
+
+    Queries run on a bounded thread pool, each thread using a connection
+    from ``SqlQuery.pool()``, so the event loop is never blocked. Keep
+    ``max_workers`` at or below the pool's ``max_connections`` so that
+    workers never wait for a connection. When a call is cancelled or times
+    out, a query that has not started is dropped and a running one is
+    aborted with ``sqlite3.Connection.interrupt``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = ConnectionPool.MAX_CONNECTIONS,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Create the facade and its worker threads
+
+        Args:
+            max_workers (int): Maximum number of queries running at once
+            timeout (Optional[float]): Default per-call timeout in seconds
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="AsyncSqlQuery"
+        )
+        self._timeout = timeout
+
+    async def __aenter__(self) -> "AsyncSqlQuery":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads once running queries finish"""
+        self._executor.shutdown(wait=False)
+
+    async def query_album(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Check if an album exists
+
+        Args:
+            name (str): Name of the album
+            timeout (Optional[float]): Seconds before the call is aborted
+
+        Returns:
+            bool: True if the album exists, False otherwise
+        """
+        return await self._run(SqlQuery.query_album, name, timeout=timeout)
+
+    async def query_albums(
+        self, titles: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, bool]:
+        """Check which of many albums exist
+
+        Args:
+            titles (Iterable[str]): Names of the albums
+            timeout (Optional[float]): Seconds before the call is aborted
+
+        Returns:
+            Dict[str, bool]: Whether each distinct title exists
+        """
+        return await self._run(SqlQuery.query_albums, list(titles), timeout=timeout)
+
+    async def join_albums(self, timeout: Optional[float] = None) -> list:
+        """Join the Album, Artist, and Track tables
+
+        Args:
+            timeout (Optional[float]): Seconds before the call is aborted
+
+        Returns:
+            list: List of (TrackName, AlbumName, ArtistName) tuples
+        """
+        return await self._run(SqlQuery.join_albums, timeout=timeout)
+
+    async def join_albums_page(
+        self, after_track_id: int = 0, limit: int = 100, timeout: Optional[float] = None
+    ) -> list:
+        """One page of ``join_albums`` using keyset pagination
+
+        Args:
+            after_track_id (int): Only return tracks with a larger TrackId
+            limit (int): Maximum number of rows to return
+            timeout (Optional[float]): Seconds before the call is aborted
+
+        Returns:
+            list: List of (TrackId, TrackName, AlbumName, ArtistName) tuples
+        """
+        return await self._run(
+            SqlQuery.join_albums_page, after_track_id, limit, timeout=timeout
+        )
+
+    async def iter_join_albums(
+        self, batch_size: int = 500, timeout: Optional[float] = None
+    ) -> AsyncIterator[tuple]:
+        """Stream the rows of ``join_albums`` page by page
+
+        No connection is held between pages, so an abandoned iterator does
+        not tie up the pool.
+
+        Args:
+            batch_size (int): Number of rows fetched per page
+            timeout (Optional[float]): Seconds before fetching a page is aborted
+
+        Yields:
+            tuple: (TrackName, AlbumName, ArtistName)
+        """
+        after = 0
+        while True:
+            page = await self.join_albums_page(after, batch_size, timeout=timeout)
+            if not page:
+                return
+            for row in page:
+                yield row[1:]
+            after = page[-1][0]
+
+    async def top_invoices(
+        self,
+        n: int = 10,
+        since: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> list:
+        """Get the top n invoices by total
+
+        Args:
+            n (int): Number of invoices to return
+            since (Optional[str]): Only invoices dated on or after this ISO date
+            customer_id (Optional[int]): Only invoices of this customer
+            timeout (Optional[float]): Seconds before the call is aborted
+
+        Returns:
+            list: List of (InvoiceId, CustomerName, Total) tuples
+        """
+        return await self._run(
+            SqlQuery.top_invoices, n, since, customer_id, timeout=timeout
+        )
+
+    async def _run(
+        self, fn: Callable[..., T], *args, timeout: Optional[float] = None
+    ) -> T:
+        call = _Call()
+
+        def work() -> T:
+            with SqlQuery.pool().connection() as conn:
+                with call.lock:
+                    if call.cancelled:
+                        raise asyncio.CancelledError()
+                    call.conn = conn
+                try:
+                    # Nested checkouts in fn reuse this thread's connection
+                    return fn(*args)
+                finally:
+                    with call.lock:
+                        call.conn = None
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, work)
+        if timeout is None:
+            timeout = self._timeout
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            call.interrupt()
+            raise
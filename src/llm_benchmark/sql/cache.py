@@ -0,0 +1,203 @@
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional, Tuple
+
+from llm_benchmark.sql.columnar import ColumnarResult
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+
+
+class _Entry(NamedTuple):
+    value: object
+    expires: float
+    size: int
+
+
+def result_size(value: object) -> int:
+    """Approximate memory footprint of a query result
+
+    Counts the list, each row tuple and each field once.
+
+    Args:
+        value (object): A value, a row tuple or a list of rows
+
+    Returns:
+        int: Size in bytes
+    """
+    if isinstance(value, ColumnarResult):
+        return value.nbytes()
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        for row in value:
+            size += sys.getsizeof(row)
+            if isinstance(row, tuple):
+                size += sum(map(sys.getsizeof, row))
+    return size
+
+
+class DatabaseVersion:
+    """Token that changes whenever a database file is modified
+
+    Combines the file's mtime and size with ``PRAGMA data_version`` read on a
+    dedicated connection, which changes as soon as any other connection
+    commits, even within the mtime granularity.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Watch a database file
+
+        Args:
+            path (str): Path of the database file
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __call__(self) -> Tuple[int, int, int]:
+        st = os.stat(self._path)
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return st.st_mtime_ns, st.st_size, data_version
+
+    def close(self) -> None:
+        """Close the watcher connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ResultCache:
+    """Thread-safe LRU cache of query results with a TTL and a memory cap
+
+    Entries are keyed by query name and parameters. An entry is dropped when
+    it is older than ``ttl`` seconds, when it is the least recently used one
+    and the cache exceeds ``maxsize`` entries or ``max_bytes`` bytes, and
+    all entries are dropped when the version token passed to :meth:`get`
+    changes.
+    """
+
+    MAXSIZE = 256
+    TTL = 300.0
+    MAX_BYTES = 64 << 20
+
+    def __init__(
+        self,
+        maxsize: int = MAXSIZE,
+        ttl: Optional[float] = TTL,
+        max_bytes: int = MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache
+
+        Args:
+            maxsize (int): Maximum number of entries
+            ttl (Optional[float]): Seconds an entry stays valid, None for ever
+            max_bytes (int): Maximum approximate size of all cached results
+            clock (Callable[[], float]): Time source, in seconds
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._size = 0
+        self._version: object = None
+        self._hits = self._misses = 0
+        self._evictions = self._expirations = self._invalidations = 0
+
+    def get(
+        self, key: Hashable, compute: Callable[[], object], version: object = None
+    ):
+        """Cached result for a key, computing and storing it on a miss
+
+        Args:
+            key (Hashable): Query name and parameters
+            compute (Callable[[], object]): Runs the query
+            version (object): Current database version token
+
+        Returns:
+            object: The result; lists are returned as fresh copies
+        """
+        now = self._clock()
+        with self._lock:
+            if version != self._version:
+                if self._entries:
+                    self._invalidations += 1
+                self._clear()
+                self._version = version
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= now:
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return _copy(entry.value)
+            self._misses += 1
+
+        value = compute()
+        size = result_size(value)
+        expires = now + self._ttl if self._ttl is not None else float("inf")
+        with self._lock:
+            if version == self._version and size <= self._max_bytes:
+                if key in self._entries:
+                    self._remove(key)
+                self._entries[key] = _Entry(value, expires, size)
+                self._size += size
+                while (
+                    len(self._entries) > self._maxsize or self._size > self._max_bytes
+                ):
+                    self._remove(next(iter(self._entries)))
+                    self._evictions += 1
+        return _copy(value)
+
+    def stats(self) -> CacheStats:
+        """Cache counters
+
+        Returns:
+            CacheStats: Hits, misses, evictions, expirations, invalidations,
+                entries and approximate size in bytes
+        """
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._expirations,
+                self._invalidations,
+                len(self._entries),
+                self._size,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters"""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        self._size -= self._entries.pop(key).size
+
+
+def _copy(value):
+    return list(value) if isinstance(value, list) else value
@@ -0,0 +1,188 @@
+import sqlite3
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Optional, Sequence as SequenceT, Union
+
+
+class DictColumn(Sequence):
+    """Dictionary-encoded column: each distinct value is stored once
+
+    Rows hold 4-byte codes into ``values``, so a value repeated on many rows
+    costs one object instead of one per row.
+    """
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes: array, values: list) -> None:
+        self.codes = codes
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.values[c] for c in self.codes[i]]
+        return self.values[self.codes[i]]
+
+
+Column = Union[DictColumn, list]
+
+
+class ColumnarResult(Sequence):
+    """Query result stored column by column
+
+    Columns with many repeated values are dictionary-encoded, the others are
+    plain lists. Rows are only assembled into tuples when indexed or
+    iterated, and slicing returns a view over the same columns without
+    copying them.
+    """
+
+    # A column is kept dictionary-encoded when at most this fraction of its
+    # values are distinct
+    MAX_DISTINCT_RATIO = 0.5
+
+    def __init__(
+        self,
+        names: SequenceT[str],
+        columns: List[Column],
+        rows: Optional[range] = None,
+    ) -> None:
+        """Wrap already built columns
+
+        Args:
+            names (Sequence[str]): Column names
+            columns (List[Column]): One column per name, all the same length
+            rows (Optional[range]): Rows of the columns visible in this view
+        """
+        self._names = tuple(names)
+        self._columns = columns
+        if rows is None:
+            rows = range(len(columns[0]) if columns else 0)
+        self._rows = rows
+
+    @classmethod
+    def from_rows(
+        cls, names: SequenceT[str], rows: Iterable[tuple]
+    ) -> "ColumnarResult":
+        """Build a columnar result from row tuples
+
+        Args:
+            names (Sequence[str]): Column names
+            rows (Iterable[tuple]): Rows, consumed once
+
+        Returns:
+            ColumnarResult: The encoded result
+        """
+        codes = [array("I") for _ in names]
+        distinct: List[list] = [[] for _ in names]
+        # Keyed on the type too: SQLite columns may mix 1 and 1.0, which
+        # compare equal but must come back as stored
+        lookups: List[Dict[tuple, int]] = [{} for _ in names]
+        for row in rows:
+            for value, lookup, col, values in zip(row, lookups, codes, distinct):
+                key = (type(value), value)
+                code = lookup.get(key)
+                if code is None:
+                    code = lookup[key] = len(values)
+                    values.append(value)
+                col.append(code)
+
+        columns: List[Column] = []
+        for values, col in zip(distinct, codes):
+            column = DictColumn(col, values)
+            if len(values) > cls.MAX_DISTINCT_RATIO * len(col):
+                columns.append(list(column))
+            else:
+                columns.append(column)
+        return cls(names, columns)
+
+    @classmethod
+    def from_cursor(
+        cls, cursor: sqlite3.Cursor, batch_size: int = 1000
+    ) -> "ColumnarResult":
+        """Build a columnar result from an executed cursor
+
+        Rows are fetched in batches, so the full list of row tuples never
+        exists in memory.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor with a pending result set
+            batch_size (int): Number of rows fetched at a time
+
+        Returns:
+            ColumnarResult: The encoded result
+        """
+        names = [d[0] for d in cursor.description]
+
+        def rows():
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    return
+                yield from batch
+
+        return cls.from_rows(names, rows())
+
+    @property
+    def names(self) -> tuple:
+        """Column names"""
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return ColumnarResult(self._names, self._columns, self._rows[i])
+        j = self._rows[i]
+        return tuple(col[j] for col in self._columns)
+
+    def __iter__(self):
+        columns = self._columns
+        for j in self._rows:
+            yield tuple(col[j] for col in columns)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (ColumnarResult, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult(names={self._names}, rows={len(self)})"
+
+    def column(self, name: str) -> list:
+        """Values of one column for the rows of this view
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            list: Column values
+        """
+        col = self._columns[self._names.index(name)]
+        return [col[j] for j in self._rows]
+
+    def to_list(self) -> list:
+        """Materialise the rows as a list of tuples
+
+        Returns:
+            list: List of row tuples
+        """
+        return list(self)
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the underlying columns
+
+        Returns:
+            int: Size in bytes
+        """
+        size = 0
+        for col in self._columns:
+            if isinstance(col, DictColumn):
+                size += sys.getsizeof(col.codes) + sys.getsizeof(col.values)
+                size += sum(map(sys.getsizeof, col.values))
+            else:
+                size += sys.getsizeof(col) + sum(map(sys.getsizeof, col))
+        return size
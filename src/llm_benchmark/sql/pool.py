@@ -0,0 +1,165 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+
+class PoolStats(NamedTuple):
+    checkouts: int
+    waits: int
+    open_connections: int
+    idle_connections: int
+
+
+class ConnectionPool:
+    """Thread-safe pool of SQLite connections
+
+    A thread holds at most one connection at a time: nested checkouts from
+    the same thread reuse the connection it already holds, and it goes back
+    to the pool when the last of them exits. Connections are
+    opened lazily up to ``max_connections``; once that many are in use,
+    further checkouts block until one is returned. Because connections are
+    long-lived, sqlite3's per-connection statement cache lets repeated
+    parameterised queries skip parsing and planning.
+    """
+
+    MAX_CONNECTIONS = 8
+    CACHED_STATEMENTS = 128
+
+    def __init__(
+        self,
+        database: str,
+        max_connections: int = MAX_CONNECTIONS,
+        uri: bool = False,
+        cached_statements: int = CACHED_STATEMENTS,
+        timeout: Optional[float] = None,
+        pragmas: Optional[Dict[str, object]] = None,
+    ) -> None:
+        """Create a pool, no connection is opened until first checkout
+
+        Args:
+            database (str): Path or URI of the database
+            max_connections (int): Maximum number of open connections
+            uri (bool): Interpret ``database`` as a URI
+            cached_statements (int): Size of each connection's statement cache
+            timeout (Optional[float]): Seconds to wait for a free connection,
+                None to wait forever
+            pragmas (Optional[Dict[str, object]]): Pragmas set on every new
+                connection
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be positive")
+        self._database = database
+        self._max_connections = max_connections
+        self._uri = uri
+        self._cached_statements = cached_statements
+        self._timeout = timeout
+        self._pragmas = dict(pragmas or {})
+
+        self._cond = threading.Condition()
+        self._idle: List[sqlite3.Connection] = []
+        self._open = 0
+        self._local = threading.local()
+        self._checkouts = 0
+        self._waits = 0
+        self._closed = False
+
+    @property
+    def database(self) -> str:
+        """Path or URI of the database"""
+        return self._database
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the duration of a ``with`` block
+
+        Yields:
+            sqlite3.Connection: Connection reserved for the calling thread
+        """
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = self._acquire()
+            local.conn, local.depth = conn, 0
+        local.depth += 1
+        try:
+            yield conn
+        finally:
+            local.depth -= 1
+            if not local.depth:
+                local.conn = None
+                self._release(conn)
+
+    def stats(self) -> PoolStats:
+        """Usage counters, useful to size ``max_connections``
+
+        Returns:
+            PoolStats: Checkouts, checkouts that had to wait, open and idle
+                connections
+        """
+        with self._cond:
+            return PoolStats(
+                self._checkouts, self._waits, self._open, len(self._idle)
+            )
+
+    def close(self) -> None:
+        """Close all idle connections and refuse further checkouts
+
+        Connections that are checked out are closed when they are returned.
+        """
+        with self._cond:
+            self._closed = True
+            for conn in self._idle:
+                conn.close()
+            self._open -= len(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+    def _can_checkout(self) -> bool:
+        return bool(self._idle) or self._closed or self._open < self._max_connections
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._database,
+            uri=self._uri,
+            check_same_thread=False,
+            cached_statements=self._cached_statements,
+        )
+        for name, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("connection pool is closed")
+            self._checkouts += 1
+            if not self._idle and self._open >= self._max_connections:
+                self._waits += 1
+                if not self._cond.wait_for(self._can_checkout, self._timeout):
+                    raise TimeoutError("timed out waiting for a database connection")
+                if self._closed:
+                    raise RuntimeError("connection pool is closed")
+            if self._idle:
+                return self._idle.pop()
+            # Reserve the slot, then connect outside the lock
+            self._open += 1
+
+        try:
+            return self._connect()
+        except BaseException:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            if self._closed:
+                conn.close()
+                self._open -= 1
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
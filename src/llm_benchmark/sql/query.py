@@ -1,8 +1,193 @@
-import sqlite3
+import os
+import threading
 from textwrap import dedent
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
+
+from llm_benchmark.sql.cache import CacheStats, DatabaseVersion, ResultCache
+from llm_benchmark.sql.columnar import ColumnarResult
+from llm_benchmark.sql.pool import ConnectionPool, PoolStats
+from llm_benchmark.sql.snapshot import (
+    MMAP_PRAGMAS,
+    MODES,
+    READ_ONLY_PRAGMAS,
+    MemorySnapshot,
+    immutable_uri,
+)
+
+DATABASE = "data/chinook.db"
+# "file", "immutable" (read-only, mmap) or "memory" (in-memory snapshot)
+DATABASE_MODE = os.environ.get("LLM_BENCHMARK_SQL_MODE", "file")
+
+QUERY_ALBUM = "SELECT 1 FROM Album WHERE Title = ? LIMIT 1"
+QUERY_ALBUMS = "SELECT DISTINCT Title FROM Album WHERE Title IN ({placeholders})"
+# Stays well below SQLite's default limit of 999 bound parameters
+QUERY_ALBUMS_CHUNK = 500
+
+JOIN_ALBUMS = dedent(
+    """\
+    SELECT
+        t.Name AS TrackName,
+        a.Title AS AlbumName,
+        ar.Name AS ArtistName
+    FROM
+        Track t
+    LEFT JOIN Album a ON a.AlbumId = t.AlbumId
+    LEFT JOIN Artist ar ON ar.ArtistId = a.ArtistId
+    ORDER BY t.TrackId
+    """
+)
+
+JOIN_ALBUMS_PAGE = dedent(
+    """\
+    SELECT
+        t.TrackId,
+        t.Name AS TrackName,
+        a.Title AS AlbumName,
+        ar.Name AS ArtistName
+    FROM
+        Track t
+    LEFT JOIN Album a ON a.AlbumId = t.AlbumId
+    LEFT JOIN Artist ar ON ar.ArtistId = a.ArtistId
+    WHERE t.TrackId > ?
+    ORDER BY t.TrackId
+    LIMIT ?
+    """
+)
+
+TOP_INVOICES = dedent(
+    """\
+    SELECT
+        i.InvoiceId,
+        c.FirstName || ' ' || c.LastName AS CustomerName,
+        i.Total
+    FROM
+        Invoice i
+    JOIN Customer c ON c.CustomerId = i.CustomerId
+    {where}
+    ORDER BY i.Total DESC, i.InvoiceId
+    LIMIT ?
+    """
+)
+
+# Covering index for top_invoices: the scan runs in Total order and can
+# evaluate the filters and the join key without touching the table.
+# The Title index turns album lookups into index seeks.
+INDEXES = {
+    "IX_Invoice_Total": "Invoice (Total, CustomerId, InvoiceDate)",
+    "IX_Album_Title": "Album (Title)",
+}
+
+
+Result = Union[list, ColumnarResult]
+
+# Serialises configure() and the lazy creation of the pool, so concurrent
+# first queries build a single pool; reentrant because pool() configures
+_CONFIGURE_LOCK = threading.RLock()
 
 
 class SqlQuery:
+    _pool: Optional[ConnectionPool] = None
+    _snapshot: Optional[MemorySnapshot] = None
+    _cache: Optional[ResultCache] = None
+    _version: Optional[DatabaseVersion] = None
+
+    @staticmethod
+    def configure(
+        database: str = DATABASE,
+        max_connections: int = ConnectionPool.MAX_CONNECTIONS,
+        timeout: Optional[float] = None,
+        mode: Optional[str] = None,
+        cache: Optional[ResultCache] = None,
+    ) -> None:
+        """Replace the connection pool used by every query
+
+        The ``immutable`` and ``memory`` modes are read-only: ``immutable``
+        opens the file without locking and memory-maps it, ``memory`` copies
+        it once into a shared in-memory database. With a ``cache``, the
+        results of ``join_albums`` and ``top_invoices`` are reused until
+        they expire or the database file changes.
+
+        Args:
+            database (str): Path of the database
+            max_connections (int): Maximum number of pooled connections
+            timeout (Optional[float]): Seconds to wait for a free connection
+            mode (Optional[str]): "file", "immutable" or "memory", defaults to
+                the LLM_BENCHMARK_SQL_MODE environment variable or "file"
+            cache (Optional[ResultCache]): Result cache, None to disable caching
+        """
+        with _CONFIGURE_LOCK:
+            mode = mode or DATABASE_MODE
+            snapshot = None
+            if mode == "file":
+                target, uri, pragmas = database, False, {}
+            elif mode == "immutable":
+                target, uri, pragmas = immutable_uri(database), True, MMAP_PRAGMAS
+            elif mode == "memory":
+                snapshot = MemorySnapshot(database)
+                target, uri, pragmas = snapshot.uri, True, READ_ONLY_PRAGMAS
+            else:
+                raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+
+            old_pool, old_snapshot = SqlQuery._pool, SqlQuery._snapshot
+            old_version = SqlQuery._version
+            SqlQuery._pool = ConnectionPool(
+                target,
+                max_connections=max_connections,
+                uri=uri,
+                timeout=timeout,
+                pragmas=pragmas,
+            )
+            SqlQuery._snapshot = snapshot
+            SqlQuery._cache = cache
+            SqlQuery._version = DatabaseVersion(database) if cache is not None else None
+            if old_pool is not None:
+                old_pool.close()
+            if old_snapshot is not None:
+                old_snapshot.close()
+            if old_version is not None:
+                old_version.close()
+
+    @staticmethod
+    def pool() -> ConnectionPool:
+        """Connection pool used by every query, created on first use
+
+        Returns:
+            ConnectionPool: The shared pool
+        """
+        pool = SqlQuery._pool
+        if pool is None:
+            with _CONFIGURE_LOCK:
+                if SqlQuery._pool is None:
+                    SqlQuery.configure()
+                pool = SqlQuery._pool
+        return pool
+
+    @staticmethod
+    def pool_stats() -> PoolStats:
+        """Usage counters of the connection pool
+
+        Returns:
+            PoolStats: Checkouts, waits, open and idle connections
+        """
+        return SqlQuery.pool().stats()
+
+    @staticmethod
+    def cache_stats() -> Optional[CacheStats]:
+        """Counters of the result cache
+
+        Returns:
+            Optional[CacheStats]: Hits, misses, evictions and more, or None
+                if caching is disabled
+        """
+        return SqlQuery._cache.stats() if SqlQuery._cache is not None else None
+
+    @staticmethod
+    def _cached(key: tuple, compute: Callable[[], Result]) -> Result:
+        cache, version = SqlQuery._cache, SqlQuery._version
+        if cache is None or version is None:
+            return compute()
+        return cache.get(key, compute, version())
+
     @staticmethod
     def query_album(name: str) -> bool:
         """Check if an album exists
@@ -13,75 +198,141 @@ class SqlQuery:
         Returns:
             bool: True if the album exists, False otherwise
         """
-        conn = sqlite3.connect("data/chinook.db")
-        try:
-            cur = conn.cursor()
+        with SqlQuery.pool().connection() as conn:
+            return conn.execute(QUERY_ALBUM, (name,)).fetchone() is not None
+
+    @staticmethod
+    def query_albums(titles: Iterable[str]) -> Dict[str, bool]:
+        """Check which of many albums exist
+
+        Titles are resolved in chunks of ``IN`` lists, one query per
+        QUERY_ALBUMS_CHUNK distinct titles.
 
-            cur.execute(f"SELECT * FROM Album WHERE Title = '{name}'")
-            return len(cur.fetchall()) > 0
-        finally:
-            conn.close()
+        Args:
+            titles (Iterable[str]): Names of the albums
+
+        Returns:
+            Dict[str, bool]: Whether each distinct title exists
+        """
+        ret = dict.fromkeys(titles, False)
+        pending = list(ret)
+        with SqlQuery.pool().connection() as conn:
+            for i in range(0, len(pending), QUERY_ALBUMS_CHUNK):
+                chunk = pending[i : i + QUERY_ALBUMS_CHUNK]
+                sql = QUERY_ALBUMS.format(placeholders=", ".join("?" * len(chunk)))
+                for (title,) in conn.execute(sql, chunk):
+                    ret[title] = True
+        return ret
 
     @staticmethod
-    def join_albums() -> list:
+    def join_albums(columnar: bool = False) -> Result:
         """Join the Album, Artist, and Track tables
 
+        Args:
+            columnar (bool): Return a ColumnarResult, which stores each
+                repeated album and artist name once
+
         Returns:
-            list:
+            list: List of (TrackName, AlbumName, ArtistName) tuples
         """
-        conn = sqlite3.connect("data/chinook.db")
-        try:
-            cur = conn.cursor()
-
-            cur.execute(
-                dedent(
-                    """\
-                    SELECT
-                        t.Name AS TrackName, (
-                            SELECT a2.Title
-                            FROM Album a2
-                            WHERE a2.AlbumId = t.AlbumId
-                        ) AS AlbumName,
-                        (
-                            SELECT ar.Name
-                            FROM Artist ar
-                            JOIN Album a3 ON a3.ArtistId = ar.ArtistId
-                            WHERE a3.AlbumId = t.AlbumId
-                        ) AS ArtistName
-                    FROM
-                        Track t
-                    """
-                )
-            )
-            return cur.fetchall()
-        finally:
-            conn.close()
+        def compute() -> Result:
+            with SqlQuery.pool().connection() as conn:
+                cur = conn.execute(JOIN_ALBUMS)
+                return ColumnarResult.from_cursor(cur) if columnar else cur.fetchall()
+
+        return SqlQuery._cached(("join_albums", columnar), compute)
 
     @staticmethod
-    def top_invoices() -> list:
-        """Get the top 10 invoices by total
+    def iter_join_albums(batch_size: int = 500) -> Iterator[tuple]:
+        """Stream the rows of ``join_albums`` without materialising them
+
+        Rows are fetched page by page with ``join_albums_page`` and no
+        connection is held between pages, so a suspended or abandoned
+        generator does not tie up the pool.
+
+        Args:
+            batch_size (int): Number of rows fetched per page
 
         Returns:
-            list: List of tuples
+            Iterator[tuple]: Generator of (TrackName, AlbumName, ArtistName)
         """
-        conn = sqlite3.connect("data/chinook.db")
-        try:
-            cur = conn.cursor()
-
-            cur.execute(
-                dedent(
-                    """\
-                    SELECT
-                        i.InvoiceId,
-                        c.FirstName || ' ' || c.LastName AS CustomerName,
-                        i.Total
-                    FROM
-                        Invoice i
-                    JOIN Customer c ON c.CustomerId = i.CustomerId
-                    ORDER BY i.Total DESC
-                    """
-                )
-            )
-            return cur.fetchall()[:10]
-        finally:
-            conn.close()
+        after = 0
+        while True:
+            page = SqlQuery.join_albums_page(after, batch_size)
+            if not page:
+                return
+            for row in page:
+                yield row[1:]
+            after = page[-1][0]
+
+    @staticmethod
+    def join_albums_page(after_track_id: int = 0, limit: int = 100) -> list:
+        """One page of ``join_albums`` using keyset pagination
+
+        Pass the TrackId of the last row of a page as ``after_track_id`` to
+        fetch the next page; each page costs an index seek, not a scan.
+
+        Args:
+            after_track_id (int): Only return tracks with a larger TrackId
+            limit (int): Maximum number of rows to return
+
+        Returns:
+            list: List of (TrackId, TrackName, AlbumName, ArtistName) tuples
+        """
+        with SqlQuery.pool().connection() as conn:
+            return conn.execute(JOIN_ALBUMS_PAGE, (after_track_id, limit)).fetchall()
+
+    @staticmethod
+    def top_invoices(
+        n: int = 10,
+        since: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Result:
+        """Get the top n invoices by total
+
+        Sorting, filtering and the limit all run inside SQLite, so only n
+        rows are transferred. Run ``create_indexes`` once to let the query
+        read the top rows straight off an index.
+
+        Args:
+            n (int): Number of invoices to return
+            since (Optional[str]): Only invoices dated on or after this
+                ISO date, e.g. "2012-01-01"
+            customer_id (Optional[int]): Only invoices of this customer
+            columnar (bool): Return a ColumnarResult instead of a list
+
+        Returns:
+            list: List of (InvoiceId, CustomerName, Total) tuples
+        """
+        clauses = []
+        params: list = []
+        if since is not None:
+            clauses.append("i.InvoiceDate >= ?")
+            params.append(since)
+        if customer_id is not None:
+            clauses.append("i.CustomerId = ?")
+            params.append(customer_id)
+        where = "WHERE " + " AND ".join(clauses) if clauses else ""
+        params.append(n)
+
+        sql = TOP_INVOICES.format(where=where)
+
+        def compute() -> Result:
+            with SqlQuery.pool().connection() as conn:
+                cur = conn.execute(sql, params)
+                return ColumnarResult.from_cursor(cur) if columnar else cur.fetchall()
+
+        key = ("top_invoices", n, since, customer_id, columnar)
+        return SqlQuery._cached(key, compute)
+
+    @staticmethod
+    def create_indexes() -> None:
+        """Create the indexes recommended for these queries, if missing
+
+        This writes to the database file, so it is never done implicitly.
+        """
+        with SqlQuery.pool().connection() as conn:
+            for name, target in INDEXES.items():
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+            conn.commit()
@@ -0,0 +1,62 @@
+import itertools
+import os
+import sqlite3
+from typing import Dict
+from urllib.request import pathname2url
+
+MODES = ("file", "immutable", "memory")
+
+# Pragmas applied to every connection of a read-only mode
+READ_ONLY_PRAGMAS: Dict[str, object] = {"query_only": 1}
+MMAP_PRAGMAS: Dict[str, object] = {"query_only": 1, "mmap_size": 1 << 28}
+
+_names = itertools.count()
+
+
+def immutable_uri(path: str) -> str:
+    """URI that opens a database file read-only and immutable
+
+    SQLite then skips all file locking and change detection.
+
+    Args:
+        path (str): Path of the database file
+
+    Returns:
+        str: URI to pass to ``sqlite3.connect(..., uri=True)``
+    """
+    return f"file:{pathname2url(os.path.abspath(path))}?mode=ro&immutable=1"
+
+
+class MemorySnapshot:
+    """Read-only copy of a database file in shared-cache memory
+
+    The file is copied once with the backup API into a named in-memory
+    database. Every connection opened on :attr:`uri` in this process sees
+    the same copy. The snapshot lives as long as this object keeps its
+    anchor connection open.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Load a database file into memory
+
+        Args:
+            path (str): Path of the database file
+        """
+        name = f"llm_benchmark_snapshot_{os.getpid()}_{next(_names)}"
+        self._uri = f"file:{name}?mode=memory&cache=shared"
+        self._anchor = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        source = sqlite3.connect(immutable_uri(path), uri=True)
+        try:
+            source.backup(self._anchor)
+        finally:
+            source.close()
+
+    @property
+    def uri(self) -> str:
+        """URI of the in-memory copy"""
+        return self._uri
+
+    def close(self) -> None:
+        """Release the in-memory copy once all its connections are closed"""
+        self._anchor.close()
+
@@ -0,0 +1,130 @@
+import string
+import unicodedata
+from typing import List
+
+# ASCII fast path: lower-case letters, drop everything but letters and digits
+_ASCII_LOWER = bytes.maketrans(
+    string.ascii_uppercase.encode(), string.ascii_lowercase.encode()
+)
+_ASCII_DELETE = bytes(
+    c for c in range(128) if not chr(c).isalnum()
+)  # punctuation, whitespace and control characters
+
+_ZWJ = "\u200d"
+
+# Hangul syllable types that may follow each type within one syllable
+_HANGUL_FOLLOWS = {
+    "L": ("L", "V", "LV", "LVT"),
+    "V": ("V", "T"),
+    "LV": ("V", "T"),
+    "T": ("T",),
+    "LVT": ("T",),
+}
+
+
+class _FoldTable(dict):
+    """``str.translate`` table that fills itself in on first use
+
+    Each code point is mapped to its case-folded, accent-free form, or to
+    the empty string if it is not a letter or digit. The mapping is
+    computed with ``unicodedata`` once per distinct code point and then
+    served from the dict.
+    """
+
+    def __missing__(self, cp: int) -> str:
+        decomposed = unicodedata.normalize("NFKD", chr(cp))
+        kept = "".join(c for c in decomposed if unicodedata.category(c)[0] in "LN")
+        folded = unicodedata.normalize("NFC", kept).casefold()
+        self[cp] = folded
+        return folded
+
+
+_FOLD_TABLE = _FoldTable()
+
+
+def _hangul_type(cp: int) -> str:
+    """Hangul syllable type of a code point: L, V, T, LV, LVT or empty"""
+    if 0x1100 <= cp <= 0x115F or 0xA960 <= cp <= 0xA97C:
+        return "L"  # leading consonants
+    if 0x1160 <= cp <= 0x11A7 or 0xD7B0 <= cp <= 0xD7C6:
+        return "V"  # vowels
+    if 0x11A8 <= cp <= 0x11FF or 0xD7CB <= cp <= 0xD7FB:
+        return "T"  # trailing consonants
+    if 0xAC00 <= cp <= 0xD7A3:  # precomposed syllables
+        return "LVT" if (cp - 0xAC00) % 28 else "LV"
+    return ""
+
+
+def _extends(cluster: str, ch: str) -> bool:
+    """Whether ``ch`` continues the grapheme cluster ``cluster``"""
+    cp = ord(ch)
+    last = cluster[-1]
+    if last == _ZWJ or ch == _ZWJ:
+        return True
+    if unicodedata.category(ch)[0] == "M":  # combining and enclosing marks
+        return True
+    if 0xFE00 <= cp <= 0xFE0F or 0xE0100 <= cp <= 0xE01EF:  # variation selectors
+        return True
+    if 0x1F3FB <= cp <= 0x1F3FF or 0xE0020 <= cp <= 0xE007F:  # skin tones, tags
+        return True
+    if 0x1F1E6 <= cp <= 0x1F1FF:  # regional indicators pair up into flags
+        return len(cluster) == 1 and 0x1F1E6 <= ord(last) <= 0x1F1FF
+    kind = _hangul_type(cp)
+    if kind:  # conjoining jamo, also after a precomposed syllable
+        return kind in _HANGUL_FOLLOWS.get(_hangul_type(ord(last)), ())
+    return last == "\r" and ch == "\n"
+
+
+class Normalizer:
+    @staticmethod
+    def fold(s: str) -> str:
+        """Normalise a string for palindrome comparison
+
+        Case-folds, strips accents and drops everything that is not a
+        letter or a digit. ASCII input takes a bytes.translate fast path.
+
+        Args:
+            s (str): String to normalise
+
+        Returns:
+            str: Normalised string
+        """
+        if s.isascii():
+            return s.encode().translate(_ASCII_LOWER, _ASCII_DELETE).decode()
+        return s.translate(_FOLD_TABLE)
+
+    @staticmethod
+    def graphemes(s: str) -> List[str]:
+        """Split a string into user-perceived characters
+
+        Approximates Unicode extended grapheme clusters: combining marks,
+        variation selectors, emoji modifiers and ZWJ sequences, flag pairs,
+        conjoining Hangul jamo and CRLF stay attached to their base.
+
+        Args:
+            s (str): String to split
+
+        Returns:
+            List[str]: Grapheme clusters in order
+        """
+        clusters: List[str] = []
+        for ch in s:
+            if clusters and _extends(clusters[-1], ch):
+                clusters[-1] += ch
+            else:
+                clusters.append(ch)
+        return clusters
+
+    @staticmethod
+    def reverse_graphemes(s: str) -> str:
+        """Reverse a string by grapheme cluster
+
+        Args:
+            s (str): String to reverse
+
+        Returns:
+            str: Reversed string with every cluster kept intact
+        """
+        if s.isascii() and "\r\n" not in s:
+            return s[::-1]
+        return "".join(reversed(Normalizer.graphemes(s)))
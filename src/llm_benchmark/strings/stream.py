@@ -0,0 +1,121 @@
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+
+from llm_benchmark.strings.strops import StrOps
+
+
+class RecordResult(NamedTuple):
+    record: int
+    is_palindrome: bool
+
+
+class LongestResult(NamedTuple):
+    record: int
+    start: int
+    stop: int
+
+
+class PalindromeFile:
+    """Streaming palindrome checks over a delimited file
+
+    The file is memory-mapped and split into records on ``delimiter``
+    without decoding it; each record is evaluated as a zero-copy memoryview
+    of the mapping. Only one record is looked at at a time, so resident
+    memory is bounded by the page cache the OS chooses to keep, not by the
+    file size.
+
+    By default records are compared byte by byte. Pass ``encoding`` to
+    decode each record on its own and compare characters instead, which is
+    what multi-byte encodings such as UTF-8 need.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        delimiter: bytes = b"\n",
+        encoding: Optional[str] = None,
+        strip_cr: bool = True,
+    ) -> None:
+        """Describe a file to scan
+
+        Args:
+            path (str): Path of the file
+            delimiter (bytes): Record separator
+            encoding (Optional[str]): Decode records with this encoding
+            strip_cr (bool): Drop a trailing b"\\r" from each record
+        """
+        if not delimiter:
+            raise ValueError("delimiter must not be empty")
+        self._path = path
+        self._delimiter = delimiter
+        self._encoding = encoding
+        self._strip_cr = strip_cr
+
+    def records(self) -> Iterator[bytes]:
+        """Yield each record as bytes
+
+        Returns:
+            Iterator[bytes]: Generator of records, without delimiters
+        """
+        for view in self._views():
+            with view:
+                yield view.tobytes()
+
+    def palindromes(self) -> Iterator[RecordResult]:
+        """Check every record for being a palindrome
+
+        Returns:
+            Iterator[RecordResult]: Record number and result, in file order
+        """
+        for record, view in enumerate(self._views()):
+            with view:
+                yield RecordResult(record, StrOps.palindrome(self._decode(view)))
+
+    def longest_palindromes(self) -> Iterator[LongestResult]:
+        """Find the longest palindromic substring of every record
+
+        Offsets are in bytes, or in characters when ``encoding`` is set.
+
+        Returns:
+            Iterator[LongestResult]: Record number and substring bounds
+        """
+        for record, view in enumerate(self._views()):
+            with view:
+                start, stop = StrOps.longest_palindrome(self._decode(view))
+            yield LongestResult(record, start, stop)
+
+    def _decode(self, view: memoryview):
+        if self._encoding is None:
+            return view
+        return str(view, self._encoding)
+
+    def _views(self) -> Iterator[memoryview]:
+        with self._mapped() as mm:
+            if mm is None:
+                return
+            with memoryview(mm) as whole:
+                delimiter, size = self._delimiter, len(mm)
+                pos = 0
+                while pos < size:
+                    end = mm.find(delimiter, pos)
+                    if end < 0:
+                        end = size
+                    stop = end
+                    if self._strip_cr and stop > pos and whole[stop - 1] == 13:
+                        stop -= 1
+                    yield whole[pos:stop]
+                    pos = end + len(delimiter)
+
+    @contextmanager
+    def _mapped(self) -> Iterator[Optional[mmap.mmap]]:
+        with open(self._path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield None  # empty files cannot be mapped
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                yield mm
+
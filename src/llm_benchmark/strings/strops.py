@@ -1,30 +1,108 @@
+from typing import Iterable, List, Tuple, Union
+
+from llm_benchmark.strings.normalize import Normalizer
+
+# Sequences the kernels accept; memoryviews are handled without copying
+StrLike = Union[str, bytes, bytearray, memoryview]
+
+
 class StrOps:
     @staticmethod
-    def str_reverse(s: str) -> str:
+    def str_reverse(s: StrLike, graphemes: bool = False) -> StrLike:
         """Reverse a string
 
+        bytes and bytearray inputs give a reversed copy of the same type; a
+        memoryview gives a reversed view of the same buffer, without copying.
+
         Args:
-            s (str): String to reverse
+            s (StrLike): String to reverse
+            graphemes (bool): Keep combining marks, emoji sequences and other
+                grapheme clusters intact; ``s`` must be a str
 
         Returns:
-            str: Reversed string
+            StrLike: Reversed string
         """
-        ret = ""
-        for i in range(len(s)):
-            ret += s[len(s) - 1 - i]
-        return ret
+        if graphemes:
+            return Normalizer.reverse_graphemes(s)
+        return s[::-1]
 
     @staticmethod
-    def palindrome(s: str) -> bool:
+    def palindrome(s: StrLike, normalized: bool = False) -> bool:
         """Check if a string is a palindrome
 
+        Compares the first half with the reversed second half, so only half
+        of the input is ever copied (none of it for a memoryview).
+
         Args:
-            s (str): String to check
+            s (StrLike): String to check
+            normalized (bool): Ignore case, accents, punctuation and spaces;
+                ``s`` must be a str
 
         Returns:
             bool: True if the string is a palindrome, False otherwise
         """
-        for i in range(len(s)):
-            if s[i] != s[len(s) - 1 - i]:
-                return False
-        return True
+        if normalized:
+            s = Normalizer.fold(s)
+        half = len(s) // 2
+        return half == 0 or s[:half] == s[: -half - 1 : -1]
+
+    @staticmethod
+    def palindromes(
+        items: Iterable[StrLike], normalized: bool = False
+    ) -> List[bool]:
+        """Check many strings for being palindromes
+
+        Tuned for many short strings, where one comparison against the full
+        reversal is cheaper than slicing halves.
+
+        Args:
+            items (Iterable[StrLike]): Strings to check
+            normalized (bool): Ignore case, accents, punctuation and spaces
+
+        Returns:
+            List[bool]: Whether each string is a palindrome, in input order
+        """
+        if normalized:
+            items = map(Normalizer.fold, items)
+        return [s == s[::-1] for s in items]
+
+    @staticmethod
+    def longest_palindrome(s: StrLike) -> Tuple[int, int]:
+        """Longest palindromic substring, using Manacher's algorithm in O(n)
+
+        Args:
+            s (StrLike): String to search
+
+        Returns:
+            Tuple[int, int]: Start and stop of the first longest palindrome,
+                so that ``s[start:stop]`` is the substring
+        """
+        n = len(s)
+        best_start, best_len = 0, 0
+
+        # Odd-length palindromes: radius k means length 2k - 1 around i
+        radius = [0] * n
+        left, right = 0, -1
+        for i in range(n):
+            k = 1 if i > right else min(radius[left + right - i], right - i + 1)
+            while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+                k += 1
+            radius[i] = k
+            if i + k - 1 > right:
+                left, right = i - k + 1, i + k - 1
+            if 2 * k - 1 > best_len:
+                best_start, best_len = i - k + 1, 2 * k - 1
+
+        # Even-length palindromes: radius k means length 2k centred before i
+        left, right = 0, -1
+        for i in range(n):
+            k = 0 if i > right else min(radius[left + right - i + 1], right - i + 1)
+            while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+                k += 1
+            radius[i] = k
+            if i + k - 1 > right:
+                left, right = i - k, i + k - 1
+            if 2 * k > best_len or (2 * k == best_len and i - k < best_start):
+                best_start, best_len = i - k, 2 * k
+
+        return best_start, best_start + best_len
@@ -0,0 +1,59 @@
+from math import prod
+from typing import List
+
+import pytest
+
+from llm_benchmark.algorithms.factor import Factorizer
+
+
+def _factors_ref(n: int) -> List[int]:
+    ret = []
+    p = 2
+    while p * p <= n:
+        while n % p == 0:
+            ret.append(p)
+            n //= p
+        p += 1
+    if n > 1:
+        ret.append(n)
+    return ret
+
+
+def test_factorize_small_matches_reference() -> None:
+    factorizer = Factorizer(spf_limit=1000)
+    for n in range(2, 3000):
+        assert factorizer.factorize(n) == _factors_ref(n)
+
+
+@pytest.mark.parametrize(
+    "factors",
+    [
+        [1_000_003, 1_000_033],
+        [4_294_967_291, 4_294_967_311],
+        [2, 2, 3, 999_983, 999_983],
+        [65_537, 2_147_483_647, 2_305_843_009_213_693_951],
+        [18_446_744_073_709_551_557],
+    ],
+)
+def test_factorize_large(factors: List[int]) -> None:
+    assert Factorizer(spf_limit=1 << 16).factorize(prod(factors)) == factors
+
+
+def test_factorize_many() -> None:
+    assert Factorizer().factorize_many([0, 1, 12, 97, 1_000_006]) == [
+        [],
+        [],
+        [2, 2, 3],
+        [97],
+        [2, 7, 71_429],
+    ]
+
+
+def test_spf_table() -> None:
+    spf = Factorizer(spf_limit=50).spf
+    assert len(spf) == 50
+    assert spf[49] == 7 and spf[48] == 2 and spf[47] == 0
+
+
+def test_benchmark_factorize_semiprime(benchmark) -> None:
+    benchmark(Factorizer().factorize, 4_294_967_291 * 4_294_967_311)
@@ -0,0 +1,28 @@
+import pytest
+
+from llm_benchmark.algorithms.parallel import ParallelSieve
+from llm_benchmark.algorithms.sieve import Sieve
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("n", [0, 2, 3, 100, 10_007])
+def test_count_and_sum(workers: int, n: int) -> None:
+    sieve = Sieve()
+    assert ParallelSieve(workers, segment_size=1000).count_and_sum(n) == (
+        sieve.count_primes(n),
+        sieve.sum_primes(n),
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("lo, hi", [(0, 0), (0, 30), (990, 5021), (7919, 7920)])
+def test_iter_primes(workers: int, lo: int, hi: int) -> None:
+    assert list(ParallelSieve(workers, segment_size=100).iter_primes(lo, hi)) == list(
+        Sieve().primes_in_range(lo, hi)
+    )
+
+
+def test_iter_primes_partial_consumption() -> None:
+    primes = ParallelSieve(2, segment_size=10).iter_primes(0, 10**9)
+    assert [next(primes) for _ in range(5)] == [2, 3, 5, 7, 11]
+    primes.close()
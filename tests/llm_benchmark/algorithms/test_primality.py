@@ -0,0 +1,41 @@
+import pytest
+
+from llm_benchmark.algorithms.primality import MillerRabin
+from llm_benchmark.algorithms.sieve import Sieve
+
+
+def test_matches_sieve() -> None:
+    sieve = Sieve()
+    assert [MillerRabin.test(n) for n in range(100_000)] == [
+        sieve.is_prime(n) for n in range(100_000)
+    ]
+
+
+@pytest.mark.parametrize(
+    "n, is_prime",
+    [
+        (3_215_031_751, False),  # strong pseudoprime to bases 2, 3, 5, 7
+        (3_825_123_056_546_413_051, False),  # strong pseudoprime to bases <= 23
+        (2_305_843_009_213_693_951, True),  # 2**61 - 1
+        (18_446_744_073_709_551_557, True),  # largest prime below 2**64
+        (18_446_744_073_709_551_615, False),  # 2**64 - 1
+        (2**89 - 1, True),
+        ((2**61 - 1) * (2**31 - 1), False),
+    ],
+)
+def test_large(n: int, is_prime: bool) -> None:
+    assert MillerRabin.test(n) == is_prime
+
+
+def test_cache_counters() -> None:
+    tester = MillerRabin(maxsize=2)
+    for n in (97, 97, 91, 97, 101, 91):
+        tester.is_prime(n)
+    info = tester.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+    tester.cache_clear()
+    assert tester.cache_info().currsize == 0
+
+
+def test_benchmark_miller_rabin(benchmark) -> None:
+    benchmark(MillerRabin.test, 18_446_744_073_709_551_557)
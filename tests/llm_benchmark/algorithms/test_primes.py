@@ -56,3 +56,35 @@ def test_prime_factors(n: int, factors: List[int]) -> None:
 
 def test_benchmark_prime_factors(benchmark) -> None:
     benchmark(Primes.prime_factors, 84)
+
+
+@pytest.mark.parametrize(
+    "lo, hi, primes",
+    [(0, 10, [2, 3, 5, 7]), (20, 40, [23, 29, 31, 37]), (24, 28, [])],
+)
+def test_primes_in_range(lo: int, hi: int, primes: List[int]) -> None:
+    assert list(Primes.primes_in_range(lo, hi)) == primes
+
+
+def test_factorize_many() -> None:
+    assert Primes.factorize_many([10, 17, 84]) == [[2, 5], [17], [2, 2, 3, 7]]
+
+
+@pytest.mark.parametrize("method", ["auto", "sieve", "miller_rabin"])
+@pytest.mark.parametrize("n, is_prime", [(1, False), (7919, True), (1_000_001, False)])
+def test_is_prime_method(n: int, is_prime: bool, method: str) -> None:
+    assert Primes.is_prime(n, method=method) == is_prime
+
+
+def test_is_prime_invalid_method() -> None:
+    with pytest.raises(ValueError):
+        Primes.is_prime(7, method="trial")
+
+
+def test_sum_primes_parallel() -> None:
+    assert Primes.sum_primes(100_000, workers=2) == Primes.sum_primes(100_000)
+    assert Primes.count_primes(100_000, workers=2) == 9592
+
+
+def test_iter_primes() -> None:
+    assert list(Primes.iter_primes(90, 110, workers=2)) == [97, 101, 103, 107, 109]
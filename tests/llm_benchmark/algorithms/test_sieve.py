@@ -0,0 +1,68 @@
+import pytest
+
+from llm_benchmark.algorithms.sieve import Sieve
+
+
+def _is_prime_ref(n: int) -> bool:
+    return n >= 2 and all(n % i for i in range(2, int(n**0.5) + 1))
+
+
+def test_is_prime_matches_reference() -> None:
+    sieve = Sieve(segment_size=64)
+    assert [sieve.is_prime(n) for n in range(5000)] == [
+        _is_prime_ref(n) for n in range(5000)
+    ]
+
+
+def test_extend_grows_incrementally() -> None:
+    sieve = Sieve(segment_size=100)
+    sieve.extend(10)
+    assert sieve.limit == Sieve.INITIAL_LIMIT
+    sieve.extend(5000)
+    assert sieve.limit == 5000
+    assert sieve.count_primes(5000) == 669
+
+
+def test_is_prime_above_max_limit() -> None:
+    sieve = Sieve(max_limit=100)
+    assert sieve.is_prime(1_000_003)
+    assert not sieve.is_prime(1_000_001)
+    assert sieve.limit < 1_000_000
+
+
+@pytest.mark.parametrize(
+    "lo, hi, ref",
+    [
+        (0, 0, []),
+        (0, 2, []),
+        (0, 12, [2, 3, 5, 7, 11]),
+        (10, 30, [11, 13, 17, 19, 23, 29]),
+        (7919, 7920, [7919]),
+    ],
+)
+def test_primes_in_range(lo: int, hi: int, ref: list) -> None:
+    assert list(Sieve(segment_size=8).primes_in_range(lo, hi)) == ref
+
+
+def test_primes_in_range_above_max_limit() -> None:
+    sieve = Sieve(segment_size=64, max_limit=2000)
+    lo, hi = 10**6, 10**6 + 500
+    assert list(sieve.primes_in_range(lo, hi)) == [
+        n for n in range(lo, hi) if _is_prime_ref(n)
+    ]
+    assert sieve.limit <= 2000
+
+
+def test_totals_above_max_limit() -> None:
+    sieve = Sieve(segment_size=1000, max_limit=2000)
+    assert sieve.count_primes(10**5) == 9592
+    assert sieve.sum_primes(10**5) == Sieve().sum_primes(10**5)
+    assert sieve.limit <= 2000
+
+
+def test_sum_primes_large() -> None:
+    assert Sieve().sum_primes(10**6) == 37550402023
+
+
+def test_benchmark_sieve_sum_primes(benchmark) -> None:
+    benchmark(Sieve().sum_primes, 10**5)
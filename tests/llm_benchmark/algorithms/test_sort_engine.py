@@ -0,0 +1,59 @@
+from random import Random
+from typing import List
+
+import pytest
+
+from llm_benchmark.algorithms.sort import Sort
+from llm_benchmark.algorithms.sort_engine import SortEngine
+
+_rng = Random(0)
+_INPUTS = [
+    [],
+    [1],
+    [5, 4, 3, 2, 1],
+    [3, 3, 2, 2, 4, 3, 0, 5],
+    [-5, 70000, 3, -(2**40), 2**63, 0, 3],
+    [_rng.randrange(-1000, 1000) for _ in range(3000)],
+    [_rng.randrange(8) for _ in range(5000)],
+    [_rng.getrandbits(48) for _ in range(2000)],
+]
+
+
+@pytest.mark.parametrize("strategy", ["auto", "timsort", "radix", "counting"])
+@pytest.mark.parametrize("v", _INPUTS)
+def test_sorted_copy(v: List[int], strategy: str) -> None:
+    original = list(v)
+    assert SortEngine.sorted_copy(v, strategy) == sorted(original)
+    assert v == original
+
+
+@pytest.mark.parametrize("strategy", ["auto", "timsort", "radix", "counting"])
+@pytest.mark.parametrize("v", _INPUTS)
+def test_sort_in_place(v: List[int], strategy: str) -> None:
+    w = list(v)
+    Sort.sort_list(w, strategy)
+    assert w == sorted(v)
+
+
+@pytest.mark.parametrize(
+    "v, strategy",
+    [
+        ([3, 1, 2], "timsort"),
+        ([_rng.randrange(8) for _ in range(5000)], "counting"),
+        ([_rng.getrandbits(48) for _ in range(5000)], "timsort"),
+        ([float(_rng.randrange(8)) for _ in range(5000)], "timsort"),
+    ],
+)
+def test_choose_strategy(v: List[int], strategy: str) -> None:
+    assert SortEngine.choose_strategy(v) == strategy
+
+
+def test_invalid_strategy() -> None:
+    with pytest.raises(ValueError):
+        SortEngine.sorted_copy([2, 1], "bogo")
+
+
+@pytest.mark.parametrize("strategy", ["timsort", "radix", "counting"])
+def test_benchmark_sort_engine(benchmark, strategy: str) -> None:
+    v = [_rng.randrange(1000) for _ in range(10_000)]
+    benchmark(SortEngine.sorted_copy, v, strategy)
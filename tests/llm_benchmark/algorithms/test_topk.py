@@ -0,0 +1,50 @@
+from random import Random
+from typing import List
+
+import pytest
+
+from llm_benchmark.algorithms.sort import Sort
+from llm_benchmark.algorithms.topk import StreamingTopK, TopK
+
+_rng = Random(0)
+_INPUTS = [
+    [5],
+    [5, 3, 2, 1, 4],
+    [1, 1, 1, 1, 1],
+    [_rng.randrange(-50, 50) for _ in range(1000)],
+    [_rng.getrandbits(40) for _ in range(1000)],
+]
+
+
+@pytest.mark.parametrize("method", ["heap", "select"])
+@pytest.mark.parametrize("k", [0, 1, 3, 10, 5000])
+@pytest.mark.parametrize("v", _INPUTS)
+def test_max_n(v: List[int], k: int, method: str) -> None:
+    assert Sort.max_n(v, k, method) == sorted(v, reverse=True)[:k]
+
+
+def test_select_does_not_modify_input() -> None:
+    v = [3, 1, 4, 1, 5, 9, 2, 6]
+    TopK.select(v, 3)
+    assert v == [3, 1, 4, 1, 5, 9, 2, 6]
+
+
+def test_max_n_invalid_method() -> None:
+    with pytest.raises(ValueError):
+        Sort.max_n([1, 2], 1, "sort")
+
+
+@pytest.mark.parametrize("k", [0, 1, 7, 2000])
+def test_streaming_top_k(k: int) -> None:
+    v = [_rng.randrange(10_000) for _ in range(1500)]
+    top = StreamingTopK(k)
+    top.push(v[0])
+    for i in range(1, len(v), 100):
+        top.extend(iter(v[i : i + 100]))
+    assert top.result() == sorted(v, reverse=True)[:k]
+    assert len(top) == min(k, len(v))
+
+
+@pytest.mark.parametrize("method", ["heap", "select"])
+def test_benchmark_max_n(benchmark, method: str) -> None:
+    benchmark(Sort.max_n, [_rng.randrange(10**6) for _ in range(10_000)], 10, method)
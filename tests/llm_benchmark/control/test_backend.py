@@ -0,0 +1,154 @@
+from random import Random
+
+import pytest
+
+from llm_benchmark.control.backend import Backend
+from llm_benchmark.control.double import DoubleForLoop
+from llm_benchmark.control.single import SingleForLoop, SingleForLoopOptimized
+
+_rng = Random(0)
+_ARR0 = [_rng.randrange(50) for _ in range(200)]
+_ARR1 = [_rng.randrange(50) for _ in range(150)]
+_MATRIX = [[_rng.randrange(-100, 100) for _ in range(30)] for _ in range(20)]
+
+
+@pytest.fixture
+def restore_backend():
+    default = Backend.get()
+    yield
+    Backend.set(default)
+
+
+def test_resolve() -> None:
+    assert Backend.resolve(None) == Backend.get()
+    assert Backend.resolve("python") == "python"
+    with pytest.raises(ValueError):
+        Backend.resolve("cuda")
+
+
+def test_set_global(restore_backend) -> None:
+    Backend.set("python")
+    assert Backend.get() == "python"
+    assert DoubleForLoop.count_pairs([1, 1, 2]) == 1
+
+
+@pytest.mark.parametrize("backend", Backend.available())
+def test_backends_agree(backend: str) -> None:
+    assert DoubleForLoop.sum_matrix(_MATRIX, backend) == sum(map(sum, _MATRIX))
+    assert DoubleForLoop.count_pairs(_ARR0, backend) == DoubleForLoop.count_pairs(
+        _ARR0, "python"
+    )
+    assert DoubleForLoop.count_duplicates(
+        _ARR0, _ARR1, backend
+    ) == DoubleForLoop.count_duplicates(_ARR0, _ARR1, "python")
+    assert SingleForLoop.max_list(_ARR0, backend) == max(_ARR0)
+    assert SingleForLoop.sum_modulus(1000, 7, backend) == sum(range(0, 1000, 7))
+
+
+def test_default_is_python() -> None:
+    assert Backend._default == "python"
+
+
+@pytest.mark.parametrize(
+    "m",
+    [
+        [],
+        [[]],
+        [[], []],
+        [[2**62, 2**62]],
+        [[-(2**62), -(2**62), -(2**62)]],
+        [[2**63, -1]],
+        [[2**70], [1]],
+        [[1, 2], [3]],
+        [[0.5, 1], [2]],
+    ],
+)
+@pytest.mark.parametrize("backend", Backend.available())
+def test_sum_matrix_matches_python(m, backend: str) -> None:
+    got = DoubleForLoop.sum_matrix(m, backend)
+    ref = DoubleForLoop.sum_matrix(m, "python")
+    assert got == ref
+    assert type(got) is type(ref)
+
+
+@pytest.mark.parametrize(
+    "v",
+    [[], [1, 1], [2**63, 2**63 + 1, 2**63], [2**63, -1, -1], [2**70, 2**70, 3]],
+)
+@pytest.mark.parametrize("backend", Backend.available())
+def test_list_kernels_match_python(v, backend: str) -> None:
+    assert DoubleForLoop.count_pairs(v, backend) == DoubleForLoop.count_pairs(
+        v, "python"
+    )
+    w = [x + 1 for x in v[:1]] + v[1:]
+    assert DoubleForLoop.count_duplicates(
+        v, w, backend
+    ) == DoubleForLoop.count_duplicates(v, w, "python")
+    if v:
+        got = SingleForLoop.max_list(v, backend)
+        assert got == SingleForLoop.max_list(v, "python")
+        assert type(got) is int
+    else:
+        with pytest.raises(IndexError):
+            SingleForLoop.max_list(v, backend)
+
+
+@pytest.mark.parametrize("n, m", [(0, 3), (-5, 2), (10, -3), (1000, 7)])
+@pytest.mark.parametrize("backend", Backend.available())
+def test_sum_modulus_matches_python(n: int, m: int, backend: str) -> None:
+    ref = SingleForLoop.sum_modulus(n, m, "python")
+    assert SingleForLoop.sum_modulus(n, m, backend) == ref
+    with pytest.raises(ZeroDivisionError):
+        SingleForLoop.sum_modulus(5, 0, backend)
+
+
+def test_numpy_sum_modulus_does_not_overflow() -> None:
+    pytest.importorskip("numpy")
+    n = 2 * 10**10
+    ref = SingleForLoopOptimized.sum_modulus(n, 7)
+    assert ref >= 1 << 63
+    assert SingleForLoop.sum_modulus(n, 7, "numpy") == ref
+
+
+def test_numpy_buffer_inputs() -> None:
+    np = pytest.importorskip("numpy")
+    from array import array
+
+    assert SingleForLoop.max_list(array("q", [3, 9, 2]), "numpy") == 9
+    assert DoubleForLoop.sum_matrix(np.arange(12).reshape(3, 4), "numpy") == 66
+    assert DoubleForLoop.count_pairs(memoryview(array("q", [1, 1, 2])), "numpy") == 1
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_benchmark_sum_matrix_backend(benchmark, backend: str) -> None:
+    if backend not in Backend.available():
+        pytest.skip("numpy is not installed")
+    benchmark(DoubleForLoop.sum_matrix, _MATRIX, backend)
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_benchmark_count_pairs_backend(benchmark, backend: str) -> None:
+    if backend not in Backend.available():
+        pytest.skip("numpy is not installed")
+    benchmark(DoubleForLoop.count_pairs, _ARR0, backend)
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_benchmark_count_duplicates_backend(benchmark, backend: str) -> None:
+    if backend not in Backend.available():
+        pytest.skip("numpy is not installed")
+    benchmark(DoubleForLoop.count_duplicates, _ARR0, _ARR1, backend)
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_benchmark_max_list_backend(benchmark, backend: str) -> None:
+    if backend not in Backend.available():
+        pytest.skip("numpy is not installed")
+    benchmark(SingleForLoop.max_list, _ARR0, backend)
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_benchmark_sum_modulus_backend(benchmark, backend: str) -> None:
+    if backend not in Backend.available():
+        pytest.skip("numpy is not installed")
+    benchmark(SingleForLoop.sum_modulus, 10_000, 3, backend)
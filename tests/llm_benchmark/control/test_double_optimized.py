@@ -0,0 +1,63 @@
+from random import Random
+
+import pytest
+
+from llm_benchmark.control.double import DoubleForLoop, DoubleForLoopOptimized
+
+_SEEDS = range(20)
+
+
+def _random_list(rng: Random) -> list:
+    return [rng.randrange(rng.randint(1, 30)) for _ in range(rng.randrange(60))]
+
+
+@pytest.mark.parametrize("n", [-3, 0, 1, 2, 3, 10, 57])
+def test_sum_square_agrees(n: int) -> None:
+    assert DoubleForLoopOptimized.sum_square(n) == DoubleForLoop.sum_square(n)
+
+
+@pytest.mark.parametrize("n", [-3, 0, 1, 2, 3, 10, 57])
+def test_sum_triangle_agrees(n: int) -> None:
+    assert DoubleForLoopOptimized.sum_triangle(n) == DoubleForLoop.sum_triangle(n)
+
+
+@pytest.mark.parametrize("seed", _SEEDS)
+def test_count_pairs_agrees(seed: int) -> None:
+    arr = _random_list(Random(seed))
+    assert DoubleForLoopOptimized.count_pairs(arr) == DoubleForLoop.count_pairs(
+        arr, "python"
+    )
+
+
+@pytest.mark.parametrize("seed", _SEEDS)
+def test_count_duplicates_agrees(seed: int) -> None:
+    rng = Random(seed)
+    arr0, arr1 = _random_list(rng), _random_list(rng)
+    assert DoubleForLoopOptimized.count_duplicates(
+        arr0, arr1
+    ) == DoubleForLoop.count_duplicates(arr0, arr1, "python")
+
+
+@pytest.mark.parametrize("seed", _SEEDS)
+def test_sum_matrix_agrees(seed: int) -> None:
+    rng = Random(seed)
+    m = [_random_list(rng) for _ in range(rng.randrange(10))]
+    assert DoubleForLoopOptimized.sum_matrix(m) == DoubleForLoop.sum_matrix(
+        m, "python"
+    )
+
+
+def test_benchmark_sum_square_optimized(benchmark) -> None:
+    benchmark(DoubleForLoopOptimized.sum_square, 100)
+
+
+def test_benchmark_sum_triangle_optimized(benchmark) -> None:
+    benchmark(DoubleForLoopOptimized.sum_triangle, 100)
+
+
+def test_benchmark_count_pairs_optimized(benchmark) -> None:
+    benchmark(DoubleForLoopOptimized.count_pairs, [1, 1, 2, 2])
+
+
+def test_benchmark_count_duplicates_optimized(benchmark) -> None:
+    benchmark(DoubleForLoopOptimized.count_duplicates, [1, 1, 2, 2], [1, 1, 2, 2])
@@ -0,0 +1,42 @@
+import pytest
+
+from llm_benchmark.control.single import SingleForLoop, SingleForLoopOptimized
+
+
+@pytest.mark.parametrize("n", [-5, 0, 1, 2, 3, 10, 101])
+def test_sum_range_agrees(n: int) -> None:
+    assert SingleForLoopOptimized.sum_range(n) == SingleForLoop.sum_range(n)
+
+
+@pytest.mark.parametrize("n", [-5, 0, 1, 2, 3, 10, 101])
+@pytest.mark.parametrize("m", [-4, -1, 1, 2, 3, 7, 200])
+def test_sum_modulus_agrees(n: int, m: int) -> None:
+    assert SingleForLoopOptimized.sum_modulus(n, m) == SingleForLoop.sum_modulus(
+        n, m, "python"
+    )
+
+
+def test_sum_modulus_zero() -> None:
+    with pytest.raises(ZeroDivisionError):
+        SingleForLoopOptimized.sum_modulus(10, 0)
+
+
+def test_beyond_int64() -> None:
+    n = 2**70
+    assert SingleForLoopOptimized.sum_range(n) == n * (n - 1) // 2
+    assert SingleForLoopOptimized.sum_modulus(n, 2**68) == 2**68 * 6
+
+
+def test_sum_where() -> None:
+    assert SingleForLoopOptimized.sum_where(100, lambda i: i % 3 == 0) == (
+        SingleForLoop.sum_modulus(100, 3, "python")
+    )
+    assert SingleForLoopOptimized.sum_where(10, lambda i: i > 6) == 24
+
+
+def test_benchmark_sum_range_optimized(benchmark) -> None:
+    benchmark(SingleForLoopOptimized.sum_range, 100)
+
+
+def test_benchmark_sum_modulus_optimized(benchmark) -> None:
+    benchmark(SingleForLoopOptimized.sum_modulus, 100, 2)
@@ -0,0 +1,108 @@
+import copy
+import pickle
+from typing import List
+
+import pytest
+
+from llm_benchmark.datastructures.dslist import DsList
+from llm_benchmark.datastructures.intarray import IntArray
+
+BIG = list(range(100_000))
+BIG_ARRAY = IntArray(BIG)
+ZEROS_ARRAY = IntArray([0] * 100_000)
+
+
+def test_intarray_is_compact_and_a_buffer() -> None:
+    a = IntArray([1, -2, 3])
+    assert a.itemsize == 8
+    with memoryview(a) as view:
+        assert view.format == "q"
+        assert view.nbytes == 24
+        assert view.tolist() == [1, -2, 3]
+    assert IntArray().tolist() == []
+    assert bytes(a) == a.tobytes()
+
+
+def test_intarray_keeps_its_type() -> None:
+    a = IntArray([1, 2, 3])
+    for value in (a[1:], a + a, a * 2, 2 * a, copy.copy(a), copy.deepcopy(a)):
+        assert type(value) is IntArray
+    assert pickle.loads(pickle.dumps(a)) == a
+    assert repr(a) == "IntArray([1, 2, 3])"
+    with pytest.raises(OverflowError):
+        IntArray([1 << 63])
+
+
+@pytest.mark.parametrize(
+    "key",
+    [slice(None), slice(1, None), slice(-2, None), slice(2, 1), slice(None, None, -1)],
+)
+def test_intarray_slices_match_list(key: slice) -> None:
+    v = [4, -1, 7, 1 << 40, 0]
+    a = IntArray(v)
+    assert a[key].tolist() == v[key]
+    assert (a + a[key]).tolist() == v + v[key]
+    assert (a[key] * 3).tolist() == v[key] * 3
+
+
+@pytest.mark.parametrize(
+    "v, n, ref",
+    [
+        ([], 1, []),
+        ([1, 2, 3, 2], 2, [1, 3]),
+        ([1, 2, 3], 9, []),
+        ([256, 1, 256], 1, [1]),
+        ([-1, 0, -1], -1, [0, 2]),
+        ([1, 2], 1 << 70, []),
+    ],
+)
+def test_find_all(v: List[int], n: int, ref: List[int]) -> None:
+    assert IntArray(v).find_all(n) == ref
+
+
+@pytest.mark.parametrize("period", [1, 2, 7, 8, 9, 100])
+def test_find_all_dense(period: int) -> None:
+    v = [0 if i % period == 0 else 1 << 8 * (i % 8) for i in range(5000)]
+    assert IntArray(v).find_all(0) == list(range(0, 5000, period))
+
+
+@pytest.mark.parametrize(
+    "v", [[], [0], [1, 2, 3, 4, 5], [3, 3, 2, 2, 4, 3, 0, 5], [-5, 1 << 40, 7, 7]]
+)
+def test_dslist_accepts_intarray(v: List[int]) -> None:
+    a = IntArray(v)
+    results = [
+        (DsList.modify_list(a), DsList.modify_list(v)),
+        (DsList.sort_list(a), DsList.sort_list(v)),
+        (DsList.reverse_list(a), DsList.reverse_list(v)),
+        (DsList.merge_lists(a, a), DsList.merge_lists(v, v)),
+        (DsList.merge_lists(a, v), DsList.merge_lists(v, v)),
+    ]
+    for n in range(len(v) + 1):
+        results.append((DsList.rotate_list(a, n), DsList.rotate_list(v, n)))
+    for got, ref in results:
+        assert type(got) is IntArray
+        assert got.tolist() == ref
+    for n in set(v) | {99}:
+        assert DsList.search_list(a, n) == DsList.search_list(v, n)
+    assert a.tolist() == v
+
+
+def test_benchmark_intarray_search(benchmark) -> None:
+    benchmark(DsList.search_list, BIG_ARRAY, 54_321)
+
+
+def test_benchmark_intarray_search_dense(benchmark) -> None:
+    benchmark(DsList.search_list, ZEROS_ARRAY, 0)
+
+
+def test_benchmark_intarray_reverse(benchmark) -> None:
+    benchmark(DsList.reverse_list, BIG_ARRAY)
+
+
+def test_benchmark_intarray_rotate(benchmark) -> None:
+    benchmark(DsList.rotate_list, BIG_ARRAY, 12_345)
+
+
+def test_benchmark_list_search(benchmark) -> None:
+    benchmark(DsList.search_list, BIG, 54_321)
@@ -0,0 +1,111 @@
+import random
+from typing import List
+
+import pytest
+
+from llm_benchmark.datastructures.dslist import DsList
+from llm_benchmark.datastructures.intarray import IntArray
+from llm_benchmark.datastructures.pipeline import ListPipeline
+
+BIG = list(range(100_000))
+
+
+def check(pipeline: ListPipeline, ref: List[int]) -> None:
+    assert len(pipeline) == len(ref)
+    assert pipeline.to_list() == ref
+    assert list(pipeline.stream()) == ref
+    assert list(pipeline) == ref
+
+
+def test_pipeline_identity() -> None:
+    check(DsList.pipeline([1, 2, 3]), [1, 2, 3])
+    check(ListPipeline([]), [])
+
+
+def test_pipeline_chain() -> None:
+    v, w = [1, 2, 3, 4, 5], [10, 20]
+    pipeline = DsList.pipeline(v).modify().rotate(2).reverse().merge(w)
+    ref = DsList.merge_lists(
+        DsList.reverse_list(DsList.rotate_list(DsList.modify_list(v), 2)), w
+    )
+    check(pipeline, ref)
+
+
+def test_pipeline_fuses_modify() -> None:
+    pipeline = ListPipeline([1, 2]).modify().modify().modify()
+    assert pipeline._parts[0][1] == [3]
+    check(pipeline, [4, 5])
+    check(pipeline.map(lambda x: x * 2).modify(), [9, 11])
+
+
+def test_pipeline_map_applies_to_merged_parts_only_after_merge() -> None:
+    pipeline = ListPipeline([1, 2]).modify().merge([10]).map(lambda x: -x)
+    check(pipeline, [-2, -3, -10])
+
+
+def test_pipeline_merge_pipeline_and_self() -> None:
+    other = ListPipeline([7, 8, 9]).reverse()
+    pipeline = ListPipeline([1, 2]).merge(other).rotate(1)
+    check(pipeline, [2, 9, 8, 7, 1])
+    check(pipeline.merge(pipeline), [2, 9, 8, 7, 1] * 2)
+    check(other, [9, 8, 7])
+
+
+def test_pipeline_sort() -> None:
+    pipeline = ListPipeline([3, 1, 2]).merge([0]).sort().modify().reverse()
+    check(pipeline, [4, 3, 2, 1])
+
+
+def test_pipeline_reads_inputs_lazily() -> None:
+    v = [1, 2, 3]
+    pipeline = ListPipeline(v).reverse()
+    v[0] = 9
+    assert pipeline.to_list() == [3, 2, 9]
+
+
+def test_pipeline_over_intarray() -> None:
+    check(ListPipeline(IntArray([1, 2, 3])).rotate(-1).modify(), [4, 2, 3])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_pipeline_random_chains(seed: int) -> None:
+    rng = random.Random(seed)
+    v = [rng.randrange(100) for _ in range(rng.randrange(12))]
+    pipeline, ref = ListPipeline(v), list(v)
+    for _ in range(8):
+        op = rng.choice(["modify", "reverse", "rotate", "merge", "map"])
+        if op == "modify":
+            pipeline.modify()
+            ref = DsList.modify_list(ref)
+        elif op == "reverse":
+            pipeline.reverse()
+            ref = DsList.reverse_list(ref)
+        elif op == "rotate":
+            n = rng.randrange(len(ref) + 1)
+            pipeline.rotate(n)
+            ref = DsList.rotate_list(ref, n)
+        elif op == "merge":
+            w = [rng.randrange(100) for _ in range(rng.randrange(4))]
+            pipeline.merge(w)
+            ref = DsList.merge_lists(ref, w)
+        else:
+            pipeline.map(lambda x: x * 3 % 7)
+            ref = [x * 3 % 7 for x in ref]
+        check(pipeline, ref)
+
+
+def eager_chain(v: List[int]) -> List[int]:
+    v = DsList.modify_list(v)
+    v = DsList.rotate_list(v, 1234)
+    v = DsList.reverse_list(v)
+    return DsList.merge_lists(v, BIG)
+
+
+def test_benchmark_eager_chain(benchmark) -> None:
+    benchmark(eager_chain, BIG)
+
+
+def test_benchmark_pipeline_chain(benchmark) -> None:
+    benchmark(
+        lambda: ListPipeline(BIG).modify().rotate(1234).reverse().merge(BIG).to_list()
+    )
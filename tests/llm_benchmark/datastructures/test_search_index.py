@@ -0,0 +1,80 @@
+import random
+from typing import List
+
+import pytest
+
+from llm_benchmark.datastructures.dslist import DsList
+from llm_benchmark.datastructures.intarray import IntArray
+from llm_benchmark.datastructures.search_index import SearchIndex
+
+RNG = random.Random(0)
+BIG = [RNG.randrange(1000) for _ in range(100_000)]
+BIG_INDEX = SearchIndex(BIG)
+QUERIES = list(range(0, 1000, 10))
+
+
+def check_index(index: SearchIndex, v: List[int]) -> None:
+    assert len(index) == len(v)
+    for n in set(v) | {-1, 10**6}:
+        assert index.positions(n) == DsList.search_list(v, n)
+        assert index.count(n) == v.count(n)
+        assert (n in index) == (n in v)
+    assert index.is_sorted == (v == sorted(v))
+    for lo, hi in [(0, 3), (2, 5), (-10, 100), (4, 4), (5, 1)]:
+        ref = [i for i, x in enumerate(v) if lo <= x < hi]
+        assert index.positions_between(lo, hi) == ref
+
+
+@pytest.mark.parametrize(
+    "v",
+    [[], [1], [1, 2, 3, 4, 5], [3, 3, 2, 2, 4, 3, 0, 5], [1, 1, 2, 2, 2, 7], [5] * 4],
+)
+def test_search_index(v: List[int]) -> None:
+    check_index(DsList.search_index(v), v)
+
+
+def test_search_index_append_and_modify() -> None:
+    rng = random.Random(42)
+    v = [rng.randrange(8) for _ in range(50)]
+    index = SearchIndex(v)
+    for _ in range(300):
+        if rng.random() < 0.3:
+            index.append(rng.randrange(8))
+        else:
+            index.modify(rng.randrange(-len(v), len(v)), rng.randrange(8))
+        check_index(index, v)
+
+
+def test_search_index_tracks_sortedness() -> None:
+    v = [1, 2, 3]
+    index = SearchIndex(v)
+    assert index.is_sorted
+    index.append(0)
+    assert not index.is_sorted
+    index.modify(3, 4)
+    assert index.is_sorted
+    check_index(index, v)
+    assert v == [1, 2, 3, 4]
+
+
+def test_search_index_over_intarray() -> None:
+    a = IntArray([4, 1, 4, 2])
+    index = SearchIndex(a)
+    index.append(4)
+    index.modify(1, 4)
+    assert index.positions(4) == [0, 1, 2, 4]
+    assert a.tolist() == [4, 4, 4, 2, 4]
+
+
+def test_search_index_bad_index() -> None:
+    index = SearchIndex([1, 2])
+    with pytest.raises(IndexError):
+        index.modify(2, 0)
+
+
+def test_benchmark_search_index_positions(benchmark) -> None:
+    benchmark(lambda: [BIG_INDEX.positions(n) for n in QUERIES])
+
+
+def test_benchmark_search_list_scans(benchmark) -> None:
+    benchmark(lambda: [DsList.search_list(BIG, n) for n in QUERIES])
@@ -0,0 +1,111 @@
+from typing import List
+
+import pytest
+
+from llm_benchmark.datastructures.dslist import DsList
+from llm_benchmark.datastructures.views import (
+    ChainView,
+    ListView,
+    ReversedView,
+    RotatedView,
+)
+
+BIG = list(range(100_000))
+SLICES = [
+    slice(None),
+    slice(1, 4),
+    slice(None, None, -1),
+    slice(None, None, 2),
+    slice(-3, None),
+    slice(5, 1),
+    slice(2, -2, 3),
+]
+
+
+def check_sequence(view, ref: List[int]) -> None:
+    assert len(view) == len(ref)
+    assert list(view) == ref
+    assert view.to_list() == ref
+    assert view == ref
+    for i in range(-len(ref), len(ref)):
+        assert view[i] == ref[i]
+    for s in SLICES:
+        assert view[s].to_list() == ref[s]
+        assert list(view[s]) == ref[s]
+        assert view[s][::-1].to_list() == ref[s][::-1]
+    with pytest.raises(IndexError):
+        view[len(ref)]
+
+
+@pytest.mark.parametrize("v", [[], [1], [1, 2, 3, 4, 5], list(range(11))])
+def test_reversed_view(v: List[int]) -> None:
+    check_sequence(DsList.reverse_view(v), DsList.reverse_list(v))
+
+
+@pytest.mark.parametrize("v", [[1], [1, 2, 3, 4, 5], list(range(11))])
+def test_rotated_view(v: List[int]) -> None:
+    for n in range(len(v) + 1):
+        check_sequence(DsList.rotate_view(v, n), DsList.rotate_list(v, n))
+    assert RotatedView(v, -1).to_list() == v[-1:] + v[:-1]
+    assert RotatedView(v, len(v) + 2) == RotatedView(v, 2)
+
+
+def test_rotated_view_empty() -> None:
+    check_sequence(RotatedView([], 3), [])
+
+
+@pytest.mark.parametrize(
+    "v1, v2",
+    [([], []), ([1, 2], []), ([], [3]), ([1, 2, 3], [4, 5, 6, 7]), ([9] * 6, [0])],
+)
+def test_chain_view(v1: List[int], v2: List[int]) -> None:
+    check_sequence(DsList.merge_view(v1, v2), DsList.merge_lists(v1, v2))
+
+
+def test_chain_view_many_parts() -> None:
+    parts = [[1], [], [2, 3], [4, 5, 6]]
+    check_sequence(ChainView(*parts), [1, 2, 3, 4, 5, 6])
+
+
+def test_views_share_storage() -> None:
+    v = [1, 2, 3]
+    rev = ReversedView(v)
+    v[0] = 10
+    assert rev.to_list() == [3, 2, 10]
+    assert isinstance(rev[1:], ReversedView)
+
+
+def test_views_compose() -> None:
+    v = list(range(10))
+    view = DsList.merge_view(DsList.rotate_view(v, 3), DsList.reverse_view(v))
+    ref = DsList.merge_lists(DsList.rotate_list(v, 3), DsList.reverse_list(v))
+    check_sequence(view, ref)
+
+
+def test_list_view_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        ListView(range(0))
+
+
+def test_benchmark_reverse_list_copy(benchmark) -> None:
+    benchmark(lambda: sum(DsList.reverse_list(BIG)))
+
+
+def test_benchmark_reverse_view(benchmark) -> None:
+    benchmark(lambda: sum(DsList.reverse_view(BIG)))
+
+
+def test_benchmark_rotate_list_copy(benchmark) -> None:
+    benchmark(lambda: sum(DsList.rotate_list(BIG, 12_345)))
+
+
+def test_benchmark_rotate_view(benchmark) -> None:
+    benchmark(lambda: sum(DsList.rotate_view(BIG, 12_345)))
+
+
+def test_benchmark_merge_lists_copy(benchmark) -> None:
+    benchmark(lambda: sum(DsList.merge_lists(BIG, BIG)))
+
+
+def test_benchmark_merge_view(benchmark) -> None:
+    benchmark(lambda: sum(DsList.merge_view(BIG, BIG)))
@@ -0,0 +1,128 @@
+import random
+from collections import Counter
+
+import pytest
+
+from llm_benchmark.control.backend import Backend
+from llm_benchmark.datastructures.intarray import IntArray
+from llm_benchmark.generator.gen_list import GenList
+
+
+@pytest.mark.parametrize(
+    "m", [1, 2, 10, 255, 256, 257, 1000, 1 << 32, (1 << 32) + 1, 1 << 70]
+)
+def test_random_list_range(m: int) -> None:
+    v = GenList.random_list(500, m, seed=1)
+    assert len(v) == 500
+    assert all(type(x) is int and 0 <= x < m for x in v)
+
+
+def test_random_list_covers_every_value() -> None:
+    counts = Counter(GenList.random_list(10_000, 10, seed=3))
+    assert sorted(counts) == list(range(10))
+    assert min(counts.values()) > 800
+
+
+@pytest.mark.parametrize("m", [10, 1000, 1 << 40])
+def test_random_list_is_reproducible(m: int) -> None:
+    assert GenList.random_list(100, m, seed=7) == GenList.random_list(100, m, seed=7)
+    assert GenList.random_list(100, m, seed=7) != GenList.random_list(100, m, seed=8)
+    rng1, rng2 = random.Random(5), random.Random(5)
+    assert GenList.random_list(50, m, rng1) == GenList.random_list(50, m, rng2)
+    assert GenList.random_list(50, m, rng1) == GenList.random_list(50, m, rng2)
+
+
+def test_random_list_bad_arguments() -> None:
+    assert GenList.random_list(0, 10) == []
+    with pytest.raises(ValueError):
+        GenList.random_list(5, 0)
+
+
+@pytest.mark.parametrize("n, m", [(0, 5), (1, 1), (3, 4), (4, 3)])
+def test_random_matrix_shape(n: int, m: int) -> None:
+    matrix = GenList.random_matrix(n, m, seed=2)
+    assert len(matrix) == n
+    assert all(len(row) == m and all(0 <= x < m for x in row) for row in matrix)
+    assert matrix == GenList.random_matrix(n, m, seed=2)
+
+
+@pytest.mark.parametrize(
+    "m, ref",
+    [
+        (10, [5, 3, 7, 6, 8, 7, 5, 7]),
+        (1000, [711, 322, 229, 596, 957, 591, 386, 226]),
+        (
+            1 << 40,
+            [
+                250897471879,
+                463900144197,
+                995681680333,
+                800146565442,
+                70301792871,
+                43781442132,
+                346028370245,
+                795263393675,
+            ],
+        ),
+    ],
+)
+def test_random_list_is_portable(m: int, ref: list) -> None:
+    # Fixed values: the same seed must give the same list on every host
+    assert GenList.random_list(8, m, seed=12345) == ref
+
+
+@pytest.mark.parametrize("m", [10, 1000, 1 << 40])
+def test_random_array(m: int) -> None:
+    a = GenList.random_array(100, m, seed=4, backend="python")
+    assert type(a) is IntArray
+    assert a.tolist() == GenList.random_list(100, m, seed=4)
+    assert len(GenList.random_array(0, m, backend="python")) == 0
+
+
+@pytest.mark.parametrize("m", [10, 1000])
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1000])
+def test_random_chunks_match_random_array(m: int, chunk_size: int) -> None:
+    chunks = list(GenList.random_chunks(250, m, chunk_size, seed=9, backend="python"))
+    assert all(type(c) is IntArray for c in chunks)
+    assert [len(c) for c in chunks[:-1]] == [chunk_size] * (len(chunks) - 1)
+    joined = [x for c in chunks for x in c]
+    assert joined == GenList.random_array(250, m, seed=9, backend="python").tolist()
+
+
+def test_random_chunks_bad_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        GenList.random_chunks(10, 10, 0)
+
+
+def test_numpy_backend() -> None:
+    np = pytest.importorskip("numpy")
+    a = GenList.random_array(100, 10, seed=1, backend="numpy")
+    assert isinstance(a, np.ndarray) and a.dtype == np.int64
+    assert ((0 <= a) & (a < 10)).all()
+    assert (a == GenList.random_array(100, 10, seed=1, backend="numpy")).all()
+    chunks = list(GenList.random_chunks(25, 10, 10, seed=1, backend="numpy"))
+    assert [len(c) for c in chunks] == [10, 10, 5]
+
+
+def test_python_is_default_backend() -> None:
+    pytest.importorskip("numpy")
+    default = Backend.get()
+    Backend.set("numpy")
+    try:
+        assert type(GenList.random_array(10, 10, seed=1)) is IntArray
+        assert all(type(c) is IntArray for c in GenList.random_chunks(10, 10, 4))
+    finally:
+        Backend.set(default)
+
+
+def test_benchmark_random_list(benchmark) -> None:
+    benchmark(GenList.random_list, 100_000, 10, 0)
+
+
+def test_benchmark_random_list_wide(benchmark) -> None:
+    benchmark(GenList.random_list, 100_000, 1 << 20, 0)
+
+
+def test_benchmark_random_list_randint(benchmark) -> None:
+    rng = random.Random(0)
+    benchmark(lambda: [rng.randint(0, 10) for _ in range(100_000)])
@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+
+from llm_benchmark.sql.async_query import AsyncSqlQuery
+from llm_benchmark.sql.query import SqlQuery
+
+ENDLESS = (
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c)"
+    " SELECT count(*) FROM c"
+)
+
+
+def _endless_query() -> int:
+    with SqlQuery.pool().connection() as conn:
+        return conn.execute(ENDLESS).fetchone()[0]
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_queries_match_sync() -> None:
+    async def main():
+        async with AsyncSqlQuery() as aq:
+            return await asyncio.gather(
+                aq.query_album("Presence"),
+                aq.query_album("Roundabout"),
+                aq.join_albums(),
+                aq.top_invoices(5, customer_id=6),
+                aq.query_albums(["Presence", "Roundabout"]),
+            )
+
+    found, missing, rows, top, albums = _run(main())
+    assert albums == {"Presence": True, "Roundabout": False}
+    assert found and not missing
+    assert rows == SqlQuery.join_albums()
+    assert top == SqlQuery.top_invoices(5, customer_id=6)
+
+
+def test_fan_out() -> None:
+    titles = ["Presence", "Roundabout", "Let There Be Rock"] * 100
+
+    async def main():
+        async with AsyncSqlQuery(max_workers=4) as aq:
+            return await asyncio.gather(*(aq.query_album(t) for t in titles))
+
+    assert _run(main()) == [SqlQuery.query_album(t) for t in titles]
+
+
+def test_iter_join_albums() -> None:
+    async def main():
+        async with AsyncSqlQuery() as aq:
+            return [row async for row in aq.iter_join_albums(batch_size=1000)]
+
+    assert _run(main()) == SqlQuery.join_albums()
+
+
+def test_timeout_interrupts_query() -> None:
+    async def main():
+        async with AsyncSqlQuery(max_workers=1) as aq:
+            with pytest.raises(asyncio.TimeoutError):
+                await aq._run(_endless_query, timeout=0.05)
+            # The worker is free again once the query was interrupted
+            return await aq.query_album("Presence", timeout=5)
+
+    start = time.monotonic()
+    assert _run(main())
+    assert time.monotonic() - start < 5
+
+
+def test_cancel() -> None:
+    async def main():
+        async with AsyncSqlQuery(max_workers=1) as aq:
+            task = asyncio.ensure_future(aq._run(_endless_query))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await aq.top_invoices(1, timeout=5)
+
+    assert _run(main())[0][2] == 25.86
+
+
+def test_benchmark_async_query_album_fan_out(benchmark) -> None:
+    async def main(aq):
+        await asyncio.gather(*(aq.query_album("Presence") for _ in range(100)))
+
+    aq = AsyncSqlQuery()
+    try:
+        benchmark(lambda: _run(main(aq)))
+    finally:
+        aq.close()
@@ -0,0 +1,125 @@
+import shutil
+import sqlite3
+
+import pytest
+
+from llm_benchmark.sql.cache import DatabaseVersion, ResultCache
+from llm_benchmark.sql.query import SqlQuery
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_hits_and_misses() -> None:
+    cache = ResultCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [(1, "a")]
+
+    assert cache.get("q", compute) == [(1, "a")]
+    assert cache.get("q", compute) == [(1, "a")]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, len(calls)) == (1, 1, 1, 1)
+
+
+def test_returns_copies() -> None:
+    cache = ResultCache()
+    cache.get("q", lambda: [1, 2]).append(3)
+    assert cache.get("q", lambda: [9]) == [1, 2]
+
+
+def test_lru_eviction() -> None:
+    cache = ResultCache(maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 0)
+    cache.get("c", lambda: 3)
+    assert cache.get("a", lambda: 0) == 1
+    assert cache.get("b", lambda: 0) == 0
+    assert cache.stats().evictions == 2
+
+
+def test_memory_cap() -> None:
+    cache = ResultCache(max_bytes=3000)
+    big = [("x" * 100,)] * 10
+    cache.get("a", lambda: big)
+    cache.get("b", lambda: big)
+    stats = cache.stats()
+    assert stats.entries == 1 and stats.evictions == 1
+    assert stats.size_bytes <= 3000
+    cache.get("huge", lambda: big * 10)
+    assert cache.stats().entries == 1
+
+
+def test_ttl() -> None:
+    clock = _Clock()
+    cache = ResultCache(ttl=10, clock=clock)
+    cache.get("a", lambda: 1)
+    clock.now = 9
+    assert cache.get("a", lambda: 2) == 1
+    clock.now = 10
+    assert cache.get("a", lambda: 2) == 2
+    assert cache.stats().expirations == 1
+
+
+def test_version_invalidates() -> None:
+    cache = ResultCache()
+    cache.get("a", lambda: 1, version=1)
+    assert cache.get("a", lambda: 2, version=2) == 2
+    assert cache.stats().invalidations == 1
+
+
+@pytest.fixture
+def database(tmp_path) -> str:
+    path = str(tmp_path / "chinook.db")
+    shutil.copyfile("data/chinook.db", path)
+    return path
+
+
+def test_database_version(database: str) -> None:
+    version = DatabaseVersion(database)
+    try:
+        before = version()
+        assert version() == before
+        conn = sqlite3.connect(database)
+        conn.execute("UPDATE Invoice SET Total = Total + 1 WHERE InvoiceId = 1")
+        conn.commit()
+        conn.close()
+        assert version() != before
+    finally:
+        version.close()
+
+
+def test_sql_query_cache(database: str) -> None:
+    SqlQuery.configure(database=database, cache=ResultCache())
+    try:
+        top = SqlQuery.top_invoices()
+        assert SqlQuery.top_invoices() == top
+        assert SqlQuery.top_invoices(3) == top[:3]
+        stats = SqlQuery.cache_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+
+        conn = sqlite3.connect(database)
+        conn.execute("UPDATE Invoice SET Total = 99.99 WHERE InvoiceId = 1")
+        conn.commit()
+        conn.close()
+        assert SqlQuery.top_invoices()[0][2] == 99.99
+        assert SqlQuery.cache_stats().invalidations == 1
+    finally:
+        SqlQuery.configure()
+    assert SqlQuery.cache_stats() is None
+
+
+def test_benchmark_join_albums_cached(benchmark, database: str) -> None:
+    SqlQuery.configure(database=database, cache=ResultCache())
+    try:
+        benchmark(SqlQuery.join_albums)
+    finally:
+        SqlQuery.configure()
@@ -0,0 +1,63 @@
+import pytest
+
+from llm_benchmark.sql.cache import result_size
+from llm_benchmark.sql.columnar import ColumnarResult, DictColumn
+from llm_benchmark.sql.query import SqlQuery
+
+_ROWS = [(i, f"track {i}", f"album {i // 10}", "artist") for i in range(100)]
+
+
+def test_round_trip() -> None:
+    result = ColumnarResult.from_rows(("id", "track", "album", "artist"), _ROWS)
+    assert len(result) == 100
+    assert result == _ROWS
+    assert result.to_list() == _ROWS
+    assert result[5] == _ROWS[5]
+    assert result[-1] == _ROWS[-1]
+    assert result.column("album") == [r[2] for r in _ROWS]
+
+
+def test_encoding_choice() -> None:
+    result = ColumnarResult.from_rows(("id", "track", "album", "artist"), _ROWS)
+    kinds = [isinstance(col, DictColumn) for col in result._columns]
+    assert kinds == [False, False, True, True]
+
+
+@pytest.mark.parametrize(
+    "s", [slice(10, 20), slice(None, None, -1), slice(5, 80, 7), slice(50, 10)]
+)
+def test_slicing_is_a_view(s: slice) -> None:
+    result = ColumnarResult.from_rows(("id", "track", "album", "artist"), _ROWS)
+    view = result[s]
+    assert isinstance(view, ColumnarResult)
+    assert view._columns is result._columns
+    assert view == _ROWS[s]
+    assert view[1:3] == _ROWS[s][1:3]
+
+
+def test_equal_values_keep_their_type() -> None:
+    rows = [(1,), (1.0,), (True,), (1,), (1.0,), (None,)] * 10
+    result = ColumnarResult.from_rows(("x",), rows)
+    assert isinstance(result._columns[0], DictColumn)
+    assert [type(r[0]) for r in result] == [type(r[0]) for r in rows]
+
+
+def test_empty() -> None:
+    result = ColumnarResult.from_rows(("a",), [])
+    assert len(result) == 0 and result == []
+
+
+def test_join_albums_columnar() -> None:
+    rows = SqlQuery.join_albums()
+    result = SqlQuery.join_albums(columnar=True)
+    assert result.names == ("TrackName", "AlbumName", "ArtistName")
+    assert result == rows
+    assert result.nbytes() * 2 < result_size(rows)
+
+
+def test_top_invoices_columnar() -> None:
+    assert SqlQuery.top_invoices(5, columnar=True) == SqlQuery.top_invoices(5)
+
+
+def test_benchmark_join_albums_columnar(benchmark) -> None:
+    benchmark(SqlQuery.join_albums, True)
@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from llm_benchmark.sql.pool import ConnectionPool
+
+
+@pytest.fixture
+def database(tmp_path) -> str:
+    path = str(tmp_path / "pool.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(10)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_reuses_connections(database: str) -> None:
+    pool = ConnectionPool(database, max_connections=2)
+    with pool.connection() as conn:
+        first = conn
+    with pool.connection() as conn:
+        assert conn is first
+    stats = pool.stats()
+    assert (stats.checkouts, stats.waits, stats.open_connections) == (2, 0, 1)
+
+
+def test_nested_checkout_same_thread(database: str) -> None:
+    pool = ConnectionPool(database, max_connections=1, timeout=0.1)
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+    assert pool.stats().open_connections == 1
+
+
+def test_nested_checkout_released_by_last_exit(database: str) -> None:
+    pool = ConnectionPool(database, max_connections=1, timeout=0.1)
+    outer = pool.connection()
+    inner = pool.connection()
+    conn = outer.__enter__()
+    assert inner.__enter__() is conn
+    outer.__exit__(None, None, None)
+    assert pool.stats().idle_connections == 0
+    pool.close()
+    assert conn.execute("SELECT count(*) FROM t").fetchone()[0] == 10
+    inner.__exit__(None, None, None)
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_waits_for_free_connection(database: str) -> None:
+    pool = ConnectionPool(database, max_connections=2)
+    results = []
+
+    def worker() -> None:
+        with pool.connection() as conn:
+            time.sleep(0.02)
+            results.append(conn.execute("SELECT sum(x) FROM t").fetchone()[0])
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = pool.stats()
+    assert results == [45] * 6
+    assert stats.checkouts == 6
+    assert stats.waits > 0
+    assert stats.open_connections == 2
+
+
+def test_timeout(database: str) -> None:
+    pool = ConnectionPool(database, max_connections=1, timeout=0.01)
+    held = threading.Event()
+    done = threading.Event()
+
+    def holder() -> None:
+        with pool.connection():
+            held.set()
+            done.wait()
+
+    t = threading.Thread(target=holder)
+    t.start()
+    held.wait()
+    try:
+        with pytest.raises(TimeoutError):
+            with pool.connection():
+                pass
+    finally:
+        done.set()
+        t.join()
+
+
+def test_close(database: str) -> None:
+    pool = ConnectionPool(database)
+    with pool.connection():
+        pass
+    pool.close()
+    assert pool.stats().open_connections == 0
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            pass
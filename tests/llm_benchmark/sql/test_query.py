@@ -1,5 +1,12 @@
+import shutil
+import sqlite3
+import threading
+import time
+
 import pytest
 
+from llm_benchmark.sql import query
+from llm_benchmark.sql.pool import ConnectionPool
 from llm_benchmark.sql.query import SqlQuery
 
 
@@ -8,6 +15,8 @@ from llm_benchmark.sql.query import SqlQuery
     [
         ("Presence", True),
         ("Roundabout", False),
+        ("Up An' Atom", True),
+        ("' OR '1'='1", False),
     ],
 )
 def test_query_album(name: str, expected: bool) -> None:
@@ -18,6 +27,31 @@ def test_benchmark_query_album(benchmark) -> None:
     benchmark(SqlQuery.query_album, "Presence")
 
 
+def test_query_albums() -> None:
+    titles = ["Presence", "Roundabout", "Up An' Atom", "Presence", ""]
+    assert SqlQuery.query_albums(titles) == {
+        "Presence": True,
+        "Roundabout": False,
+        "Up An' Atom": True,
+        "": False,
+    }
+    assert SqlQuery.query_albums([]) == {}
+
+
+def test_query_albums_many_chunks() -> None:
+    with SqlQuery.pool().connection() as conn:
+        existing = [title for (title,) in conn.execute("SELECT Title FROM Album")]
+    titles = existing + [f"missing {i}" for i in range(1200)]
+    result = SqlQuery.query_albums(titles)
+    assert sum(result.values()) == len(set(existing))
+    assert len(result) == len(set(titles))
+
+
+def test_benchmark_query_albums(benchmark) -> None:
+    titles = ["Presence", "Roundabout"] * 50 + [f"missing {i}" for i in range(100)]
+    benchmark(SqlQuery.query_albums, titles)
+
+
 def test_join_albums() -> None:
     assert SqlQuery.join_albums()[0] == (
         "For Those About To Rock (We Salute You)",
@@ -30,6 +64,39 @@ def test_benchmark_join_albums(benchmark) -> None:
     benchmark(SqlQuery.join_albums)
 
 
+@pytest.mark.parametrize("batch_size", [1, 64, 10_000])
+def test_iter_join_albums(batch_size: int) -> None:
+    assert list(SqlQuery.iter_join_albums(batch_size)) == SqlQuery.join_albums()
+
+
+def test_iter_join_albums_interleaved() -> None:
+    g1 = SqlQuery.iter_join_albums(64)
+    g2 = SqlQuery.iter_join_albums(64)
+    first = [next(g1), next(g2)]
+    rows = list(g1)
+    SqlQuery.configure()
+    expected = SqlQuery.join_albums()
+    assert [first[0]] + rows == expected
+    assert [first[1]] + list(g2) == expected
+
+
+def test_join_albums_page() -> None:
+    rows = []
+    after = 0
+    while True:
+        page = SqlQuery.join_albums_page(after_track_id=after, limit=1000)
+        if not page:
+            break
+        assert len(page) <= 1000
+        rows += [row[1:] for row in page]
+        after = page[-1][0]
+    assert rows == SqlQuery.join_albums()
+
+
+def test_benchmark_iter_join_albums(benchmark) -> None:
+    benchmark(lambda: sum(1 for _ in SqlQuery.iter_join_albums()))
+
+
 def test_top_invoices() -> None:
     top = SqlQuery.top_invoices()
     assert top[0][2] == 25.86
@@ -39,3 +106,100 @@ def test_top_invoices() -> None:
 
 def test_benchmark_top_invoices(benchmark) -> None:
     benchmark(SqlQuery.top_invoices)
+
+
+FULL_SCAN_TOP_INVOICES = """
+    SELECT i.InvoiceId, c.FirstName || ' ' || c.LastName, i.Total
+    FROM Invoice i JOIN Customer c ON c.CustomerId = i.CustomerId
+    ORDER BY i.Total DESC, i.InvoiceId
+"""
+
+
+def _top_invoices_full_scan(n: int = 10) -> list:
+    conn = sqlite3.connect("data/chinook.db")
+    try:
+        return conn.execute(FULL_SCAN_TOP_INVOICES).fetchall()[:n]
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("n", [0, 1, 10, 1000])
+def test_top_invoices_n(n: int) -> None:
+    assert SqlQuery.top_invoices(n) == _top_invoices_full_scan(n)
+
+
+def test_top_invoices_filters() -> None:
+    rows = SqlQuery.top_invoices(5, since="2013-01-01", customer_id=6)
+    conn = sqlite3.connect("data/chinook.db")
+    try:
+        ref = conn.execute(
+            "SELECT InvoiceId, Total FROM Invoice"
+            " WHERE InvoiceDate >= '2013-01-01' AND CustomerId = 6"
+            " ORDER BY Total DESC, InvoiceId LIMIT 5"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert [(r[0], r[2]) for r in rows] == ref
+    assert all(r[1] == "Helena Holý" for r in rows)
+
+
+def test_create_indexes(tmp_path) -> None:
+    path = str(tmp_path / "chinook.db")
+    shutil.copyfile("data/chinook.db", path)
+    SqlQuery.configure(database=path)
+    try:
+        SqlQuery.create_indexes()
+        assert SqlQuery.top_invoices() == _top_invoices_full_scan()
+        with SqlQuery.pool().connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT InvoiceId FROM Invoice ORDER BY Total DESC"
+            ).fetchall()
+            assert any("IX_Invoice_Total" in row[-1] for row in plan)
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT 1 FROM Album WHERE Title = 'x'"
+            ).fetchall()
+            assert any("IX_Album_Title" in row[-1] for row in plan)
+        assert SqlQuery.query_album("Presence")
+    finally:
+        SqlQuery.configure()
+
+
+def test_benchmark_top_invoices_full_scan(benchmark) -> None:
+    benchmark(_top_invoices_full_scan)
+
+
+def test_pool_stats() -> None:
+    before = SqlQuery.pool_stats().checkouts
+    SqlQuery.query_album("Presence")
+    stats = SqlQuery.pool_stats()
+    assert stats.checkouts == before + 1
+    assert stats.open_connections >= 1
+
+
+def test_pool_created_once_under_contention(monkeypatch) -> None:
+    created = []
+
+    class CountingPool(ConnectionPool):
+        def __init__(self, *args, **kwargs) -> None:
+            created.append(self)
+            time.sleep(0.01)  # widen the window between the check and the set
+            super().__init__(*args, **kwargs)
+
+    SqlQuery.pool().close()
+    SqlQuery._pool = None
+    monkeypatch.setattr(query, "ConnectionPool", CountingPool)
+    barrier = threading.Barrier(16)
+
+    def worker() -> None:
+        barrier.wait()
+        assert SqlQuery.query_album("Presence")
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(created) == 1
+    finally:
+        SqlQuery.configure()
@@ -0,0 +1,69 @@
+import sqlite3
+
+import pytest
+
+from llm_benchmark.sql.query import SqlQuery
+from llm_benchmark.sql.snapshot import MODES, MemorySnapshot, immutable_uri
+
+
+@pytest.fixture(params=MODES)
+def mode(request):
+    SqlQuery.configure(mode=request.param)
+    yield request.param
+    SqlQuery.configure()
+
+
+def test_queries_agree_across_modes(mode: str) -> None:
+    assert SqlQuery.query_album("Presence")
+    assert not SqlQuery.query_album("Roundabout")
+    assert len(SqlQuery.join_albums()) == 3503
+    assert SqlQuery.top_invoices()[0][2] == 25.86
+
+
+def test_read_only_modes_reject_writes() -> None:
+    for mode in ("immutable", "memory"):
+        SqlQuery.configure(mode=mode)
+        try:
+            with SqlQuery.pool().connection() as conn:
+                with pytest.raises(sqlite3.OperationalError):
+                    conn.execute("DELETE FROM Album")
+        finally:
+            SqlQuery.configure()
+
+
+def test_memory_snapshot_is_shared() -> None:
+    snapshot = MemorySnapshot("data/chinook.db")
+    try:
+        a = sqlite3.connect(snapshot.uri, uri=True)
+        b = sqlite3.connect(snapshot.uri, uri=True)
+        assert a.execute("SELECT count(*) FROM Track").fetchone() == (3503,)
+        assert b.execute("SELECT count(*) FROM Track").fetchone() == (3503,)
+        a.close()
+        b.close()
+    finally:
+        snapshot.close()
+
+
+def test_immutable_uri() -> None:
+    conn = sqlite3.connect(immutable_uri("data/chinook.db"), uri=True)
+    try:
+        assert conn.execute("SELECT count(*) FROM Album").fetchone() == (347,)
+    finally:
+        conn.close()
+
+
+def test_invalid_mode() -> None:
+    with pytest.raises(ValueError):
+        SqlQuery.configure(mode="remote")
+
+
+def test_benchmark_query_album_mode(benchmark, mode: str) -> None:
+    benchmark(SqlQuery.query_album, "Presence")
+
+
+def test_benchmark_join_albums_mode(benchmark, mode: str) -> None:
+    benchmark(SqlQuery.join_albums)
+
+
+def test_benchmark_top_invoices_mode(benchmark, mode: str) -> None:
+    benchmark(SqlQuery.top_invoices)
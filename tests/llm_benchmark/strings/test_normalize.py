@@ -0,0 +1,116 @@
+import pytest
+
+from llm_benchmark.strings.normalize import Normalizer
+from llm_benchmark.strings.strops import StrOps
+
+ASCII_CORPUS = [
+    "A man, a plan, a canal: Panama!",
+    "Was it a car or a cat I saw?",
+    "No 'x' in Nixon",
+    "Hello, World",
+] * 250
+UNICODE_CORPUS = [
+    "Ésope reste ici et se repose",
+    "Ça, né? Ç'en a.",
+    "Straße",
+    "А роза упала на лапу Азора",
+] * 250
+
+
+@pytest.mark.parametrize(
+    "s, ref",
+    [
+        ("", ""),
+        ("A man, a plan", "amanaplan"),
+        ("Tab\tand\nnewline 42", "tabandnewline42"),
+        ("Ésope", "esope"),
+        ("Straße", "strasse"),
+        ("ﬁne", "fine"),
+        ("ΣΟΦΟΣ", "σοφοσ"),
+        ("日本, 語!", "日本語"),
+        ("가나다", "가나다"),
+        ("smile 🙂", "smile"),
+    ],
+)
+def test_fold(s: str, ref: str) -> None:
+    assert Normalizer.fold(s) == ref
+
+
+@pytest.mark.parametrize(
+    "s, ref",
+    [
+        ("", []),
+        ("abc", ["a", "b", "c"]),
+        ("éa", ["é", "a"]),
+        ("a\r\nb", ["a", "\r\n", "b"]),
+        (
+            "\U0001F1EB\U0001F1F7\U0001F1E9\U0001F1EA",
+            ["\U0001F1EB\U0001F1F7", "\U0001F1E9\U0001F1EA"],
+        ),
+        ("\U0001F44D\U0001F3FDx", ["\U0001F44D\U0001F3FD", "x"]),
+        (
+            "\U0001F468\u200d\U0001F469\u200d\U0001F467!",
+            ["\U0001F468\u200d\U0001F469\u200d\U0001F467", "!"],
+        ),
+        ("❤\ufe0f", ["❤\ufe0f"]),
+        ("각", ["각"]),
+        ("\uac00\u11a8\ub098", ["\uac00\u11a8", "\ub098"]),
+        ("\uac01\u11a8", ["\uac01\u11a8"]),
+        ("\u1100\uac00", ["\u1100\uac00"]),
+        ("\uac00\uac00", ["\uac00", "\uac00"]),
+    ],
+)
+def test_graphemes(s: str, ref: list) -> None:
+    assert Normalizer.graphemes(s) == ref
+    assert "".join(Normalizer.graphemes(s)) == s
+
+
+@pytest.mark.parametrize(
+    "s, ref",
+    [
+        ("", ""),
+        ("hello", "olleh"),
+        ("a\r\nb", "b\r\na"),
+        ("café!", "!éfac"),
+        ("a\U0001F1EB\U0001F1F7", "\U0001F1EB\U0001F1F7a"),
+        ("\uac00\u11a8\ub098", "\ub098\uac00\u11a8"),
+    ],
+)
+def test_reverse_graphemes(s: str, ref: str) -> None:
+    assert Normalizer.reverse_graphemes(s) == ref
+    assert StrOps.str_reverse(s, graphemes=True) == ref
+
+
+@pytest.mark.parametrize(
+    "s, ref",
+    [
+        ("A man, a plan, a canal: Panama!", True),
+        ("Was it a car or a cat I saw?", True),
+        ("Ésope reste ici et se repose", True),
+        ("А роза упала на лапу Азора", True),
+        ("Ça, né? Ç'en a.", False),
+        ("Hello, World", False),
+        ("!!!", True),
+        ("", True),
+    ],
+)
+def test_palindrome_normalized(s: str, ref: bool) -> None:
+    assert StrOps.palindrome(s, normalized=True) == ref
+    assert StrOps.palindromes([s], normalized=True) == [ref]
+
+
+def test_palindrome_default_is_exact() -> None:
+    assert not StrOps.palindrome("Abba")
+    assert StrOps.palindrome("Abba", normalized=True)
+
+
+def test_benchmark_normalized_palindromes_ascii(benchmark) -> None:
+    benchmark(StrOps.palindromes, ASCII_CORPUS, True)
+
+
+def test_benchmark_normalized_palindromes_unicode(benchmark) -> None:
+    benchmark(StrOps.palindromes, UNICODE_CORPUS, True)
+
+
+def test_benchmark_reverse_graphemes(benchmark) -> None:
+    benchmark(Normalizer.reverse_graphemes, "café \U0001F44D\U0001F3FD " * 100)
@@ -0,0 +1,95 @@
+import pytest
+
+from llm_benchmark.strings.stream import PalindromeFile
+from llm_benchmark.strings.strops import StrOps
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(b"racecar\nhello\r\n\nabba\nxyzzyq\n")
+    return str(path)
+
+
+def test_records(corpus: str) -> None:
+    assert list(PalindromeFile(corpus).records()) == [
+        b"racecar",
+        b"hello",
+        b"",
+        b"abba",
+        b"xyzzyq",
+    ]
+
+
+def test_records_custom_delimiter(tmp_path) -> None:
+    path = tmp_path / "corpus.bin"
+    path.write_bytes(b"aa\x00ab\x00a")
+    assert list(PalindromeFile(str(path), delimiter=b"\x00").records()) == [
+        b"aa",
+        b"ab",
+        b"a",
+    ]
+
+
+def test_empty_file(tmp_path) -> None:
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(PalindromeFile(str(path)).palindromes()) == []
+
+
+def test_palindromes(corpus: str) -> None:
+    results = list(PalindromeFile(corpus).palindromes())
+    assert [r.is_palindrome for r in results] == [True, False, True, True, False]
+    assert [r.record for r in results] == [0, 1, 2, 3, 4]
+
+
+def test_palindromes_decoded(tmp_path) -> None:
+    path = tmp_path / "utf8.txt"
+    path.write_text("été\naña\n", encoding="utf-8")
+    assert [r.is_palindrome for r in PalindromeFile(str(path)).palindromes()] == [
+        False,
+        False,
+    ]
+    decoded = PalindromeFile(str(path), encoding="utf-8").palindromes()
+    assert [r.is_palindrome for r in decoded] == [True, True]
+
+
+def test_longest_palindromes(corpus: str) -> None:
+    results = list(PalindromeFile(corpus).longest_palindromes())
+    assert [(r.start, r.stop) for r in results] == [
+        (0, 7),
+        (2, 4),
+        (0, 0),
+        (0, 4),
+        (1, 5),
+    ]
+
+
+def test_generator_can_be_abandoned(corpus: str) -> None:
+    results = PalindromeFile(corpus).palindromes()
+    assert next(results).is_palindrome
+    results.close()
+
+
+@pytest.mark.parametrize(
+    "s, ref",
+    [
+        ("", ""),
+        ("a", "a"),
+        ("ab", "a"),
+        ("babad", "bab"),
+        ("cbbd", "bb"),
+        ("forgeeksskeegfor", "geeksskeeg"),
+        (b"xabacabay", b"abacaba"),
+    ],
+)
+def test_longest_palindrome(s, ref) -> None:
+    start, stop = StrOps.longest_palindrome(s)
+    assert s[start:stop] == ref
+
+
+def test_benchmark_palindrome_file(benchmark, tmp_path) -> None:
+    path = tmp_path / "bench.txt"
+    path.write_bytes(b"racecar\nhello\nabba\nabc\n" * 2500)
+    scanner = PalindromeFile(str(path))
+    benchmark(lambda: sum(r.is_palindrome for r in scanner.palindromes()))
@@ -0,0 +1,77 @@
+from typing import List
+
+import pytest
+
+from llm_benchmark.strings.strops import StrOps
+
+
+@pytest.mark.parametrize(
+    "s, ref",
+    [
+        ("", ""),
+        ("a", "a"),
+        ("racecar", "racecar"),
+        ("hello", "olleh"),
+        (b"hello", b"olleh"),
+        (bytearray(b"ab"), bytearray(b"ba")),
+    ],
+)
+def test_str_reverse(s, ref) -> None:
+    assert StrOps.str_reverse(s) == ref
+    assert type(StrOps.str_reverse(s)) is type(s)
+
+
+def test_str_reverse_memoryview_is_a_view() -> None:
+    buf = bytearray(b"abc")
+    view = StrOps.str_reverse(memoryview(buf))
+    assert view.obj is buf
+    buf[0] = ord("z")
+    assert view.tobytes() == b"cbz"
+
+
+def test_benchmark_str_reverse(benchmark) -> None:
+    benchmark(StrOps.str_reverse, "racecar")
+
+
+@pytest.mark.parametrize(
+    "s, ref",
+    [
+        ("", True),
+        ("a", True),
+        ("ab", False),
+        ("aa", True),
+        ("racecar", True),
+        ("abba", True),
+        ("abca", False),
+        ("hello", False),
+    ],
+)
+def test_palindrome(s: str, ref: bool) -> None:
+    assert StrOps.palindrome(s) == ref
+    encoded = s.encode()
+    assert StrOps.palindrome(encoded) == ref
+    assert StrOps.palindrome(bytearray(encoded)) == ref
+    assert StrOps.palindrome(memoryview(encoded)) == ref
+
+
+def test_benchmark_palindrome(benchmark) -> None:
+    benchmark(StrOps.palindrome, "racecar")
+
+
+@pytest.mark.parametrize(
+    "items, ref",
+    [
+        ([], []),
+        (
+            ["racecar", "hello", "", b"abba", memoryview(b"abc")],
+            [True, False, True, True, False],
+        ),
+    ],
+)
+def test_palindromes(items: list, ref: List[bool]) -> None:
+    assert StrOps.palindromes(items) == ref
+    assert StrOps.palindromes(iter(items)) == ref
+
+
+def test_benchmark_palindromes(benchmark) -> None:
+    benchmark(StrOps.palindromes, ["racecar", "hello", "abba", "abc"] * 250)